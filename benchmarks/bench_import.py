@@ -0,0 +1,87 @@
+"""Cold-start benchmark: import time and first-use cost of samsungcrawler.
+
+Each scenario runs in a fresh interpreter, --repeat times, and reports the
+median wall time plus which heavy dependencies it ended up loading. Results
+go to benchmarks/results/import.json. A scenario slower than --budget seconds
+makes the script exit with status 1.
+
+    python benchmarks/bench_import.py [--repeat N] [--budget SECONDS]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT_DIR = os.path.dirname(BENCH_DIR)
+RESULTS_PATH = os.path.join(BENCH_DIR, "results", "import.json")
+HEAVY_MODULES = ("pandas", "playwright", "bs4", "httpx", "openpyxl", "lxml", "rich.console")
+
+SCENARIOS = {
+    "python": "pass",
+    "import": "import samsungcrawler",
+    "construct": (
+        "import samsungcrawler\n"
+        "samsungcrawler.SamsungScraper('Samsung Content.xlsx', 'out.xlsx', 'https://www.samsung.com/us/search/?q=', 0, 0)"
+    ),
+    "extract_dimensions": (
+        "import samsungcrawler\n"
+        "scraper = samsungcrawler.SamsungScraper(None, None, 'https://www.samsung.com/us/search/?q=', 0, 0)\n"
+        "scraper.extract_dimensions({'Dimensions': {'Product Dimensions': '57.1\" x 32.7\" x 1.0\"'}})"
+    ),
+    "load_workbook": (
+        "import samsungcrawler\n"
+        "samsungcrawler.SamsungScraper('Samsung Content.xlsx', 'out.xlsx', 'https://www.samsung.com/us/search/?q=', 0, 0).df"
+    ),
+}
+REPORT = "\nimport sys\nprint(','.join(m for m in {modules!r} if m in sys.modules))"
+
+
+def run_scenario(code: str, repeat: int):
+    samples = []
+    loaded = ""
+    for _ in range(repeat):
+        start = time.perf_counter()
+        completed = subprocess.run(
+            [sys.executable, "-c", code + REPORT.format(modules=HEAVY_MODULES)],
+            cwd=ROOT_DIR, capture_output=True, text=True, check=True,
+        )
+        samples.append(time.perf_counter() - start)
+        loaded = completed.stdout.strip().splitlines()[-1] if completed.stdout.strip() else ""
+    return {
+        "median_s": statistics.median(samples),
+        "min_s": min(samples),
+        "loaded": [module for module in loaded.split(",") if module],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--budget", type=float, default=1.0, help="Maximum median seconds for the lazy scenarios.")
+    args = parser.parse_args()
+
+    results = {"created": time.time(), "python": sys.version.split()[0], "scenarios": {}}
+    over_budget = []
+    for name, code in SCENARIOS.items():
+        stats = run_scenario(code, args.repeat)
+        results["scenarios"][name] = stats
+        print(f"{name:>20}: median {stats['median_s'] * 1000:8.1f} ms  min {stats['min_s'] * 1000:8.1f} ms  "
+              f"loaded: {', '.join(stats['loaded']) or '-'}")
+        # Reading the workbook needs pandas; every other scenario should stay under budget.
+        if name != "load_workbook" and stats["median_s"] > args.budget:
+            over_budget.append(name)
+
+    os.makedirs(os.path.dirname(RESULTS_PATH), exist_ok=True)
+    with open(RESULTS_PATH, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
+    for name in over_budget:
+        print(f"OVER BUDGET {name}: {results['scenarios'][name]['median_s']:.2f} s > {args.budget:.2f} s")
+    return 1 if over_budget else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
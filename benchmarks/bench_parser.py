@@ -0,0 +1,83 @@
+"""Micro-benchmark of the product page parser backends.
+
+Parses every saved product page in the fixture directory with each backend,
+checks that all backends return identical fields and reports the time per page.
+With no saved pages it falls back to synthetic pages in both layouts. Small
+edge-case pages (script text, block elements inside values, ...) are always
+checked for identical fields but left out of the timings.
+
+    python benchmarks/bench_parser.py [--fixtures DIR] [--repeat N]
+"""
+import argparse
+import contextlib
+import glob
+import io
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from product_parser import PARSERS  # noqa: E402
+from corpus import DEFAULT_ROOT, edge_case_pages, synthetic_page  # noqa: E402
+
+DEFAULT_FIXTURES = os.path.join(DEFAULT_ROOT, "product")
+
+
+def load_pages(fixtures: str):
+    pages = {}
+    for path in sorted(glob.glob(os.path.join(fixtures, "*.html"))):
+        with open(path, encoding="utf-8") as f:
+            pages[os.path.basename(path)] = f.read()
+    if not pages:
+        print(f"No saved pages in {fixtures}; using synthetic pages.")
+        pages = {"synthetic-legacy": synthetic_page("legacy"), "synthetic-module": synthetic_page("module")}
+    return pages
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--fixtures", default=DEFAULT_FIXTURES)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    pages = load_pages(args.fixtures)
+    total_mb = sum(len(html) for html in pages.values()) / 1_000_000
+    print(f"{len(pages)} pages, {total_mb:.1f} MB")
+
+    backends = {}
+    for name, backend in PARSERS.items():
+        try:
+            backends[name] = backend()
+        except ImportError as e:
+            print(f"Skipping {name}: {e}")
+
+    results = {}
+    timings = {}
+    for name, backend in backends.items():
+        best = None
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            with contextlib.redirect_stdout(io.StringIO()):
+                results[name] = {page: backend.parse(html) for page, html in pages.items()}
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        timings[name] = best
+        print(f"{name:>5}: {best / len(pages) * 1000:8.1f} ms/page")
+        with contextlib.redirect_stdout(io.StringIO()):
+            results[name].update({page: backend.parse(html) for page, html in edge_case_pages().items()})
+
+    reference = results.get("bs4")
+    mismatches = 0
+    for name, parsed in results.items():
+        for page, fields in parsed.items():
+            if reference is not None and fields != reference[page]:
+                mismatches += 1
+                print(f"MISMATCH {name}: {page}")
+    if "bs4" in timings and "lxml" in timings:
+        print(f"lxml speedup: {timings['bs4'] / timings['lxml']:.1f}x")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
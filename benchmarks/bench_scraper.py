@@ -0,0 +1,217 @@
+"""Offline benchmark and regression check for SamsungScraper.
+
+Replays the fixture corpus through a local HTTP stand-in and times
+search_product, scrape_product_details, extract_dimensions and
+check_certification. Each stage reports ops/sec, p50/p95 latency and the
+peak RSS of this process plus its children (Chromium included) sampled while
+the stage ran; the run is written to benchmarks/results/latest.json and
+compared against benchmarks/baseline.json. A stage that got slower than the
+baseline by more than --tolerance makes the script exit with status 1; p95
+must also have grown by at least --min-delta-ms, so sub-millisecond stages
+don't fail on timer noise.
+
+    python benchmarks/bench_scraper.py                    # run and compare
+    python benchmarks/bench_scraper.py --update-baseline  # run and store as baseline
+    python benchmarks/bench_scraper.py --require-baseline # fail if there is nothing to compare against
+
+A missing baseline is only a note locally; with --require-baseline, or when
+the CI environment variable is set, it fails the run like a regression.
+
+Without a recorded corpus a synthetic one is generated. Browser stages are
+skipped (and left out of the comparison) when Chromium cannot be launched.
+"""
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT_DIR = os.path.dirname(BENCH_DIR)
+sys.path.insert(0, ROOT_DIR)
+
+from samsungcrawler import SamsungScraper  # noqa: E402
+from browser_pool import process_tree_rss_mb  # noqa: E402
+from navigation_policy import NavigationPolicy  # noqa: E402
+from corpus import DEFAULT_ROOT, Corpus, synthetic_corpus  # noqa: E402
+from replay_server import ReplayServer  # noqa: E402
+
+RESULTS_PATH = os.path.join(BENCH_DIR, "results", "latest.json")
+BASELINE_PATH = os.path.join(BENCH_DIR, "baseline.json")
+
+
+def percentile(samples, pct: float) -> float:
+    ordered = sorted(samples)
+    if len(ordered) == 1:
+        return ordered[0]
+    return statistics.quantiles(ordered, n=100, method="inclusive")[int(pct) - 1]
+
+
+class RssSampler:
+    """Peak process-tree RSS over the samples taken for one stage (None if unmeasurable)."""
+    def __init__(self):
+        self.peak = None
+        self.sample()
+
+    def sample(self):
+        rss = process_tree_rss_mb()
+        if rss is not None and (self.peak is None or rss > self.peak):
+            self.peak = rss
+
+
+def summarize(samples, rss: RssSampler):
+    total = sum(samples)
+    rss.sample()
+    return {
+        "count": len(samples),
+        "ops_per_sec": len(samples) / total if total else 0.0,
+        "p50_ms": percentile(samples, 50) * 1000,
+        "p95_ms": percentile(samples, 95) * 1000,
+        "peak_rss_mb": rss.peak,
+    }
+
+
+async def timed(samples, rss: RssSampler, coroutine):
+    start = time.perf_counter()
+    result = await coroutine
+    samples.append(time.perf_counter() - start)
+    rss.sample()  # Outside the timed region: walking /proc is not free.
+    return result
+
+
+async def run_benchmarks(corpus, args):
+    stages = {}
+    with ReplayServer(corpus, latency=args.latency_ms / 1000) as server:
+        scraper = SamsungScraper(
+            excel_path=args.workbook,
+            output_filename=os.devnull,
+            baseurl=server.search_url,
+            found=0,
+            missing=0,
+            headless=True,
+            http_fast_path=not args.browser_only,
+        )
+        # The stand-in is local: don't let per-host rate control dominate the timings.
+        scraper.navigation = NavigationPolicy(metrics=scraper.metrics, rate=10_000, burst=10_000, max_rate=10_000)
+        browser = True
+        try:
+            await scraper.launch_browser()
+        except Exception as e:
+            browser = False
+            print(f"Chromium unavailable, skipping browser stages: {str(e).splitlines()[0]}")
+            await scraper.playwright.stop()
+            scraper.open_http_client()
+        try:
+            if browser:
+                samples, rss = [], RssSampler()
+                for term, entry in corpus.manifest["search"].items():
+                    await timed(samples, rss, scraper.search_product(term, mfr_number=entry["mfr_number"]))
+                if samples:
+                    stages["search_product"] = summarize(samples, rss)
+
+            products = []
+            if browser or scraper.http_client:
+                samples, rss = [], RssSampler()
+                for path in corpus.manifest["product"]:
+                    try:
+                        products.append(await timed(samples, rss, scraper.scrape_product_details(server.url + path)))
+                    except Exception as e:
+                        print(f"scrape_product_details failed for {path}: {e}")
+                if samples:
+                    stages["scrape_product_details"] = summarize(samples, rss)
+        finally:
+            if browser:
+                await scraper.close_browser()
+            elif scraper.http_client:
+                await scraper.http_client.aclose()
+
+    specs = [product["specifications"] for product in products if product and product["specifications"]]
+    if specs:
+        for name, func in (("extract_dimensions", scraper.extract_dimensions), ("check_certification", scraper.check_certification)):
+            samples, rss = [], RssSampler()
+            for _ in range(args.repeat):
+                for spec in specs:
+                    start = time.perf_counter()
+                    func(spec)
+                    samples.append(time.perf_counter() - start)
+            stages[name] = summarize(samples, rss)
+    return stages
+
+
+def compare(results, baseline, tolerance: float, min_delta_ms: float = 1.0):
+    """Return a list of regressions of results against baseline.
+
+    A p95 regression needs both the relative `tolerance` and an absolute
+    increase of `min_delta_ms`.
+    """
+    regressions = []
+    for stage, current in results["stages"].items():
+        previous = baseline.get("stages", {}).get(stage)
+        if not previous:
+            continue
+        if current["ops_per_sec"] < previous["ops_per_sec"] * (1 - tolerance):
+            regressions.append(f"{stage}: ops/sec {current['ops_per_sec']:.1f} < baseline {previous['ops_per_sec']:.1f}")
+        if (current["p95_ms"] > previous["p95_ms"] * (1 + tolerance)
+                and current["p95_ms"] - previous["p95_ms"] >= min_delta_ms):
+            regressions.append(f"{stage}: p95 {current['p95_ms']:.2f} ms > baseline {previous['p95_ms']:.2f} ms")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--corpus", default=DEFAULT_ROOT, help="Fixture corpus directory.")
+    parser.add_argument("--workbook", default=os.path.join(ROOT_DIR, "Samsung Content.xlsx"))
+    parser.add_argument("--repeat", type=int, default=200, help="Repetitions for the pure-Python stages.")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Artificial delay per replayed response.")
+    parser.add_argument("--browser-only", action="store_true", help="Disable the HTTP fast path for product pages.")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed slowdown before a stage counts as a regression.")
+    parser.add_argument("--min-delta-ms", type=float, default=1.0,
+                        help="Smallest p95 increase that can count as a regression.")
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument("--require-baseline", action="store_true", default=bool(os.environ.get("CI")),
+                        help="Exit 1 when the baseline is missing (default when $CI is set).")
+    parser.add_argument("--verbose", action="store_true", help="Show the scraper's own console output.")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        corpus = Corpus(args.corpus)
+        if not corpus:
+            print(f"No recorded corpus in {args.corpus}; using a synthetic one.")
+            corpus = synthetic_corpus(tmp)
+        output = contextlib.nullcontext() if args.verbose else contextlib.redirect_stdout(io.StringIO())
+        with output:
+            stages = asyncio.run(run_benchmarks(corpus, args))
+
+    results = {"created": time.time(), "corpus": args.corpus, "stages": stages}
+    for stage, stats in stages.items():
+        rss = "n/a" if stats["peak_rss_mb"] is None else f"{stats['peak_rss_mb']:.0f} MB"
+        print(f"{stage:>24}: {stats['ops_per_sec']:9.1f} ops/s  p50 {stats['p50_ms']:8.2f} ms  "
+              f"p95 {stats['p95_ms']:8.2f} ms  peak RSS {rss}")
+
+    os.makedirs(os.path.dirname(RESULTS_PATH), exist_ok=True)
+    with open(RESULTS_PATH, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
+
+    if args.update_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        print(f"Baseline written to {args.baseline}")
+        return 0
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}; run with --update-baseline to create one.")
+        return 1 if args.require_baseline else 0
+    with open(args.baseline, encoding="utf-8") as f:
+        regressions = compare(results, json.load(f), args.tolerance, args.min_delta_ms)
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,188 @@
+"""Fixture corpus of recorded Samsung search and product pages.
+
+Layout under the corpus root (benchmarks/fixtures by default):
+
+    manifest.json        {"search": {term: {"file", "mfr_number", "state"}}, "product": {path: {"file", "layout"}}}
+    search/<slug>.html   rendered search result pages
+    product/<slug>.html  rendered product pages, legacy or CSS-module layout
+
+Pages are stored with their <script> tags removed so they replay as static DOM snapshots.
+A search page's state is "results", "no-results" (the scraper's no-results selector
+matched) or "unmarked" (a miss the selector did not recognise).
+"""
+import json
+import os
+import re
+
+DEFAULT_ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+SCRIPT_RE = re.compile(r"<script\b[^>]*>.*?</script\s*>", re.IGNORECASE | re.DOTALL)
+
+
+def slugify(value: str) -> str:
+    return re.sub(r"[^A-Za-z0-9]+", "-", value).strip("-").lower() or "index"
+
+
+def detect_layout(html: str) -> str:
+    """'legacy' for spec-details__list pages, 'module' for Specs_* CSS-module pages."""
+    if "spec-details__list" in html:
+        return "legacy"
+    if "Specs_specDetailList" in html:
+        return "module"
+    return "unknown"
+
+
+def strip_scripts(html: str) -> str:
+    return SCRIPT_RE.sub("", html)
+
+
+class Corpus:
+    """Read/write access to a fixture corpus directory."""
+    def __init__(self, root: str = DEFAULT_ROOT):
+        self.root = root
+        self.manifest_path = os.path.join(root, "manifest.json")
+        self.manifest = {"search": {}, "product": {}}
+        if os.path.exists(self.manifest_path):
+            with open(self.manifest_path, encoding="utf-8") as f:
+                self.manifest = json.load(f)
+
+    def __bool__(self):
+        return bool(self.manifest["search"] or self.manifest["product"])
+
+    def _write(self, kind: str, slug: str, html: str) -> str:
+        directory = os.path.join(self.root, kind)
+        os.makedirs(directory, exist_ok=True)
+        filename = f"{kind}/{slug}.html"
+        with open(os.path.join(self.root, filename), "w", encoding="utf-8") as f:
+            f.write(strip_scripts(html))
+        return filename
+
+    def add_search(self, search_term: str, mfr_number: str, html: str, state: str = "results"):
+        filename = self._write("search", slugify(search_term), html)
+        self.manifest["search"][search_term] = {"file": filename, "mfr_number": mfr_number, "state": state}
+
+    def add_product(self, path: str, html: str):
+        filename = self._write("product", slugify(path), html)
+        self.manifest["product"][path] = {"file": filename, "layout": detect_layout(html)}
+
+    def read(self, filename: str) -> str:
+        with open(os.path.join(self.root, filename), encoding="utf-8") as f:
+            return f.read()
+
+    def search_page(self, search_term: str):
+        entry = self.manifest["search"].get(search_term)
+        return self.read(entry["file"]) if entry else None
+
+    def product_page(self, path: str):
+        entry = self.manifest["product"].get(path)
+        return self.read(entry["file"]) if entry else None
+
+    def save(self):
+        os.makedirs(self.root, exist_ok=True)
+        with open(self.manifest_path, "w", encoding="utf-8") as f:
+            json.dump(self.manifest, f, indent=2, sort_keys=True)
+
+
+def synthetic_page(layout: str, sections: int = 40, items: int = 25, filler_kb: int = 2000):
+    """Build a large product page in the legacy or CSS-module layout."""
+    parts = ["<html><head><title>Synthetic</title></head><body>"]
+    parts.append("<div class='filler'>" + ("<span class='x'>lorem ipsum</span>" * (filler_kb * 1024 // 34)) + "</div>")
+    parts.append("<img src='https://image-us.samsung.com/SamsungUS/a.png'><img src='https://image-us.samsung.com/SamsungUS/$hero$.jpg'>")
+    if layout == "legacy":
+        parts.append("<ul class='product-details__info-description'><li>Bright\n\tdisplay</li></ul>")
+        parts.append("<span class='product-top-nav__font-price'> $1,299 <sup>.99</sup> </span>")
+        parts.append("<ul class='row spec-details__list'>")
+        parts.append("<li itemscope><span itemprop='name'>Dimensions</span>"
+                     "<div class='sub-specs__item'><span class='specs-item-name'>Product Dimensions</span>"
+                     "<p class='sub-specs__item__value'>57.1\" x 32.7\" x 1.0\"</p></div>"
+                     "<div class='sub-specs__item'><span class='specs-item-name'>Product Weight</span>"
+                     "<p class='sub-specs__item__value'>45.2 lb</p></div></li>")
+        for s in range(sections):
+            parts.append(f"<li itemscope><span itemprop='name'>Section {s}</span>")
+            for i in range(items):
+                parts.append(
+                    f"<div class='sub-specs__item'><span class='specs-item-name'>Key {i}</span>"
+                    f"<p class='sub-specs__item__value'> Value {s}.{i} </p></div>"
+                )
+            parts.append("</li>")
+        parts.append("</ul><div class='span-sm-2 span-lg-2 spec-download'><a href='https://x/spec.pdf'>PDF</a></div>")
+    else:
+        parts.append("<div class='ProductSummary_detailList__zDn4_'><p>Slim\ndesign</p></div>")
+        parts.append("<div class='PriceInfoText_priceInfo__QEjy8'>Now <b> $899.99 </b></div>")
+        parts.append("<ul class='Specs_specRow__e9Ife Specs_specDetailList__StjuR'>")
+        parts.append("<li><figure><figcaption>Power</figcaption>"
+                     "<div class='subSpecsItem'><div class='Specs_subSpecItemName__IUPV4'>Voltz/Hertz/Amps</div>"
+                     "<div class='Specs_subSpecsItemValue__oWnMq'>120 V / 60 Hz / 15 A</div></div>"
+                     "<div class='subSpecsItem'><div class='Specs_subSpecItemName__IUPV4'>Certification</div>"
+                     "<div class='Specs_subSpecsItemValue__oWnMq'>ENERGY STAR Certification</div></div></figure></li>")
+        for s in range(sections):
+            parts.append(f"<li><figure><figcaption>Section {s}</figcaption>")
+            for i in range(items):
+                parts.append(
+                    f"<div class='subSpecsItem'><div class='Specs_subSpecItemName__IUPV4'>Key {i}</div>"
+                    f"<div class='Specs_subSpecsItemValue__oWnMq'> Value {s}.{i} </div></div>"
+                )
+            parts.append("</figure></li>")
+        parts.append("</ul>")
+    parts.append("</body></html>")
+    return "".join(parts)
+
+
+def edge_case_pages():
+    """Small pages for markup where the parser backends are easy to get out of step."""
+    legacy_item = ("<div class='sub-specs__item'><span class='specs-item-name'>{key}</span>"
+                   "<p class='sub-specs__item__value'>{value}</p></div>")
+
+    def legacy(description, price, items, pdf="<a href='https://x/spec.pdf'>PDF</a>"):
+        return (
+            "<html><head><style>.p{color:red}</style></head><body>"
+            f"<ul class='product-details__info-description'>{description}</ul>"
+            f"<span class='product-top-nav__font-price'>{price}</span>"
+            "<ul class='row spec-details__list'><li itemscope><span itemprop='name'>General</span>"
+            + "".join(legacy_item.format(key=key, value=value) for key, value in items)
+            + f"</li></ul><div class='span-sm-2 span-lg-2 spec-download'>{pdf}</div></body></html>"
+        )
+
+    return {
+        "edge-script-in-description": legacy(
+            "<li>Bright<script>window.dataLayer = [];</script> display<style>li{}</style></li>",
+            "$499<script>track()</script>", [("Product Weight", "20 lb")],
+        ),
+        "edge-block-in-value": legacy(
+            "<li>Compact</li>", "$99", [("Features", "Quiet<div>Energy saving</div>mode"), ("Product Weight", "9 lb")],
+        ),
+        "edge-list-in-value": legacy(
+            "<li>Compact</li>", "$99", [("Ports", "<ul><li>HDMI</li><li>USB</li></ul>")],
+        ),
+        "edge-pdf-without-link": legacy("<li>Compact</li>", "$99", [("Product Weight", "9 lb")], pdf="PDF"),
+        "edge-template-in-description": legacy(
+            "<li>Quiet<template><span>Hidden</span></template> wash</li>", "$649", [("Product Weight", "150 lb")],
+        ),
+        "edge-xml-declaration": "<?xml version='1.0' encoding='utf-8'?>\n" + legacy(
+            "<li>Compact</li>", "$99", [("Product Weight", "9 lb")],
+        ),
+    }
+
+
+def synthetic_search_page(cards):
+    """Build a static search results page from (mdl_code, href) pairs."""
+    parts = ["<html><body><div class='TabHeader-module__tabHeader___3VfJw'>Products</div>"]
+    for mdl_code, href in cards:
+        parts.append(
+            f"<div class='ProductCard__container___3tGUh' data-mdlcode='{mdl_code}'>"
+            f"<a href='{href}'>{mdl_code}</a></div>"
+        )
+    parts.append("</body></html>")
+    return "".join(parts)
+
+
+def synthetic_corpus(root: str, products: int = 6, filler_kb: int = 500) -> Corpus:
+    """Write a small synthetic corpus (both layouts) for runs where nothing has been recorded."""
+    corpus = Corpus(root)
+    for n in range(products):
+        layout = "legacy" if n % 2 == 0 else "module"
+        mdl_code = f"QN{55 + n}SYN{n}/ZA"
+        path = f"/us/televisions-home-theater/tvs/qn{55 + n}syn{n}-za/"
+        corpus.add_product(path, synthetic_page(layout, filler_kb=filler_kb))
+        corpus.add_search(mdl_code, mdl_code, synthetic_search_page([(f"QN{55 + n}OTHER", "/us/other/"), (mdl_code, path)]))
+    corpus.save()
+    return corpus
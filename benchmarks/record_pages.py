@@ -0,0 +1,82 @@
+"""Record live Samsung search and product pages into the fixture corpus.
+
+    python benchmarks/record_pages.py --workbook "Samsung Content.xlsx" --limit 20
+
+For each row the mfr number is searched on samsung.com, the rendered results page
+is saved, and the matched product page is saved after expanding "See All Specs".
+Search pages without results are checked against the scraper's NO_RESULTS_SELECTOR;
+a miss it does not match is reported so the selector can be updated from that page.
+"""
+import argparse
+import asyncio
+import os
+import sys
+from urllib.parse import urlparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from samsungcrawler import NO_RESULTS_SELECTOR, TAB_HEADER_SELECTOR, SamsungScraper  # noqa: E402
+from navigation_policy import RetryableError  # noqa: E402
+from corpus import DEFAULT_ROOT, Corpus  # noqa: E402
+
+SEARCH_URL = "https://www.samsung.com/us/search/searchMain/?listType=g&searchTerm="
+
+
+async def search_state(page):
+    """State of the rendered search page, as stored in the corpus manifest."""
+    if await page.locator(TAB_HEADER_SELECTOR).count():
+        return "results"
+    if await page.locator(NO_RESULTS_SELECTOR).count():
+        return "no-results"
+    return "unmarked"
+
+
+async def record(args):
+    corpus = Corpus(args.root)
+    scraper = SamsungScraper(
+        excel_path=args.workbook,
+        output_filename=os.devnull,
+        baseurl=SEARCH_URL,
+        found=0,
+        missing=0,
+        headless=True,
+        http_fast_path=False,
+    )
+    await scraper.launch_browser()
+    try:
+        rows = scraper.df.head(args.limit) if args.limit else scraper.df
+        for _, row in rows.iterrows():
+            mfr_number = str(row["mfr number"])
+            try:
+                url = await scraper.search_product(mfr_number, mfr_number=mfr_number)
+            except RetryableError as e:
+                # Also what an unrecognised no-results page looks like: keep it for inspection.
+                print(f"{mfr_number}: search failed ({e.category})")
+                url = None
+            state = await search_state(scraper.page)
+            corpus.add_search(mfr_number, mfr_number, await scraper.page.content(), state)
+            if state == "unmarked":
+                print(f"{mfr_number}: no results, but NO_RESULTS_SELECTOR does not match the saved search page")
+            if not url:
+                print(f"{mfr_number}: no match, search page saved")
+                continue
+            async with scraper.pool.page() as page:
+                await scraper.scrape_product_details_browser(url, page=page)
+                corpus.add_product(urlparse(url).path, await page.content())
+            print(f"{mfr_number}: {url}")
+            corpus.save()
+    finally:
+        corpus.save()
+        await scraper.close_browser()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workbook", default="Samsung Content.xlsx")
+    parser.add_argument("--root", default=DEFAULT_ROOT, help="Corpus directory.")
+    parser.add_argument("--limit", type=int, default=0, help="Only record the first N rows.")
+    asyncio.run(record(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
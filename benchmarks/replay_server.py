@@ -0,0 +1,78 @@
+"""Local HTTP stand-in for samsung.com that serves a recorded fixture corpus."""
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+SEARCH_PATH = "/us/search/searchMain/"
+EMPTY_SEARCH_PAGE = "<html><body><div class='NoResult-module__noResult'>Try another search term</div></body></html>"
+
+
+class ReplayServer:
+    """Serve corpus pages on 127.0.0.1 from a background thread.
+
+    Search URLs are answered from the recorded search pages (an empty results page
+    when the term was never recorded); any other path is looked up as a product page.
+    `latency` adds a fixed delay per response to mimic network round-trips.
+    """
+    def __init__(self, corpus, port: int = 0, latency: float = 0.0):
+        self.corpus = corpus
+        self.latency = latency
+        self.requests = 0
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                server.requests += 1
+                status, body = server.respond(self.path)
+                if server.latency:
+                    time.sleep(server.latency)
+                payload = body.encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", port), Handler)
+        self.thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def search_url(self) -> str:
+        """Value to pass as SamsungScraper's baseurl."""
+        return self.url + SEARCH_PATH + "?listType=g&searchTerm="
+
+    def respond(self, raw_path: str):
+        parsed = urlparse(raw_path)
+        if parsed.path == SEARCH_PATH:
+            term = parse_qs(parsed.query).get("searchTerm", [""])[0]
+            return 200, self.corpus.search_page(term) or EMPTY_SEARCH_PAGE
+        html = self.corpus.product_page(parsed.path)
+        if html is None:
+            return 404, "<html><body>Not found</body></html>"
+        return 200, html
+
+    def start(self):
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
@@ -0,0 +1,234 @@
+import asyncio
+import os
+import sys
+from contextlib import asynccontextmanager
+from rich import print
+try:
+    import psutil
+except ImportError:  # optional: falls back to /proc on Linux
+    psutil = None
+
+
+def process_tree_rss_mb(pid: int = None):
+    """Resident memory of a process and all its descendants (Chromium runs under the
+    Playwright driver, a child of this process). None when it can't be measured."""
+    pid = pid or os.getpid()
+    if psutil is not None:
+        try:
+            root = psutil.Process(pid)
+            processes = [root] + root.children(recursive=True)
+            total = 0
+            for process in processes:
+                try:
+                    total += process.memory_info().rss
+                except psutil.Error:
+                    pass
+            return total / (1024 * 1024)
+        except psutil.Error:
+            return None
+    if not sys.platform.startswith("linux"):
+        return None
+    children = {}
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat", encoding="utf-8") as f:
+                # The command name may contain spaces, so split after its closing paren.
+                ppid = int(f.read().rsplit(")", 1)[1].split()[1])
+        except (OSError, IndexError, ValueError):
+            continue
+        children.setdefault(ppid, []).append(int(entry))
+    page_size = os.sysconf("SC_PAGE_SIZE")
+    total = 0
+    stack = [pid]
+    while stack:
+        current = stack.pop()
+        stack.extend(children.get(current, []))
+        try:
+            with open(f"/proc/{current}/statm", encoding="utf-8") as f:
+                total += int(f.read().split()[1]) * page_size
+        except (OSError, IndexError, ValueError):
+            pass
+    return total / (1024 * 1024)
+
+
+class BrowserSlot:
+    def __init__(self, browser):
+        self.browser = browser
+        self.contexts = set()
+        self.served = 0
+        self.retired = False
+
+
+class ContextSlot:
+    def __init__(self, context, browser_slot):
+        self.context = context
+        self.browser_slot = browser_slot
+        self.idle = []
+        self.in_use = 0
+        self.served = 0
+        self.retired = False
+
+
+class BrowserPool:
+    """Pool of Chromium contexts and pages shared by the scraper's workers.
+
+    Released pages are reset to about:blank and handed out again. A context is
+    retired after `max_pages_per_context` pages and the whole browser is
+    relaunched after `max_pages_per_browser` pages or once the process tree
+    grows past `max_rss_mb`. Retired contexts and browsers are closed as soon
+    as their last page is released, so in-flight work is never interrupted.
+    Pages released after an error are closed rather than reused.
+    """
+    def __init__(self, launch, context_setup=None, max_pages_per_context: int = 200,
+                 max_pages_per_browser: int = 2000, max_rss_mb: float = None, rss_check_interval: int = 25):
+        self.launch = launch
+        self.context_setup = context_setup
+        self.max_pages_per_context = max_pages_per_context
+        self.max_pages_per_browser = max_pages_per_browser
+        self.max_rss_mb = max_rss_mb
+        self.rss_check_interval = rss_check_interval
+        self.browser_slot = None
+        self.context_slot = None
+        self.page_slots = {}
+        self.lock = asyncio.Lock()
+        self.acquired = 0
+        self.context_recycles = 0
+        self.browser_relaunches = 0
+
+    @property
+    def browser(self):
+        return self.browser_slot.browser if self.browser_slot else None
+
+    @property
+    def context(self):
+        return self.context_slot.context if self.context_slot else None
+
+    async def start(self):
+        async with self.lock:
+            await self._ensure_context()
+        return self
+
+    async def _ensure_context(self):
+        if self.browser_slot is None or self.browser_slot.retired:
+            self.browser_slot = BrowserSlot(await self.launch())
+            self.context_slot = None
+        if self.context_slot is None or self.context_slot.retired:
+            context = await self.browser_slot.browser.new_context()
+            if self.context_setup:
+                await self.context_setup(context)
+            self.context_slot = ContextSlot(context, self.browser_slot)
+            self.browser_slot.contexts.add(self.context_slot)
+        return self.context_slot
+
+    async def _check_limits(self):
+        slot = self.context_slot
+        if slot and slot.served >= self.max_pages_per_context:
+            await self._retire_context(slot)
+            self.context_recycles += 1
+        browser_slot = self.browser_slot
+        if browser_slot is None or browser_slot.retired:
+            return
+        relaunch = browser_slot.served >= self.max_pages_per_browser
+        if not relaunch and self.max_rss_mb and self.acquired % self.rss_check_interval == 0:
+            rss = process_tree_rss_mb()
+            if rss is not None and rss > self.max_rss_mb:
+                print(f"[yellow]Browser RSS {rss:.0f} MB over {self.max_rss_mb} MB, relaunching Chromium[/yellow]")
+                relaunch = True
+        if relaunch:
+            await self._retire_browser(browser_slot)
+            self.browser_relaunches += 1
+
+    async def acquire(self):
+        """Take an idle page from the current context, opening a new one if needed."""
+        async with self.lock:
+            await self._check_limits()
+            slot = await self._ensure_context()
+            page = slot.idle.pop() if slot.idle else await slot.context.new_page()
+            slot.in_use += 1
+            slot.served += 1
+            slot.browser_slot.served += 1
+            self.acquired += 1
+            self.page_slots[page] = slot
+            return page
+
+    async def release(self, page, discard: bool = False):
+        """Return a page to the pool; `discard` closes it instead of reusing it."""
+        async with self.lock:
+            slot = self.page_slots.pop(page, None)
+            if slot is None:
+                return
+            slot.in_use -= 1
+            if not discard and not slot.retired:
+                try:
+                    await page.goto("about:blank")
+                    slot.idle.append(page)
+                    return
+                except Exception:
+                    pass
+            await self._close_quietly(page)
+            if slot.retired and slot.in_use == 0:
+                await self._close_context(slot)
+
+    @asynccontextmanager
+    async def page(self):
+        """`async with pool.page() as page:` guarantees the page is released, even on errors."""
+        page = await self.acquire()
+        discard = False
+        try:
+            yield page
+        except BaseException:
+            discard = True
+            raise
+        finally:
+            await self.release(page, discard=discard)
+
+    async def _retire_context(self, slot):
+        slot.retired = True
+        for page in slot.idle:
+            await self._close_quietly(page)
+        slot.idle = []
+        if slot.in_use == 0:
+            await self._close_context(slot)
+
+    async def _retire_browser(self, browser_slot):
+        browser_slot.retired = True
+        for slot in list(browser_slot.contexts):
+            await self._retire_context(slot)
+        if not browser_slot.contexts:
+            await self._close_quietly(browser_slot.browser)
+
+    async def _close_context(self, slot):
+        await self._close_quietly(slot.context)
+        browser_slot = slot.browser_slot
+        browser_slot.contexts.discard(slot)
+        if browser_slot.retired and not browser_slot.contexts:
+            await self._close_quietly(browser_slot.browser)
+
+    @staticmethod
+    async def _close_quietly(closable):
+        try:
+            await closable.close()
+        except Exception:
+            pass
+
+    async def close(self):
+        """Close every page, context and browser the pool still holds."""
+        async with self.lock:
+            for page in list(self.page_slots):
+                await self._close_quietly(page)
+            self.page_slots.clear()
+            if self.browser_slot:
+                for slot in list(self.browser_slot.contexts):
+                    slot.in_use = 0
+                await self._retire_browser(self.browser_slot)
+            self.browser_slot = None
+            self.context_slot = None
+
+    def stats(self) -> dict:
+        return {
+            "pages_acquired": self.acquired,
+            "context_recycles": self.context_recycles,
+            "browser_relaunches": self.browser_relaunches,
+        }
@@ -0,0 +1,147 @@
+import hashlib
+import html
+import json
+import re
+import sqlite3
+import time
+
+
+# Class attributes of the two spec list layouts, in the order the parsers try them.
+SPEC_LIST_MARKERS = (
+    re.compile(r"""class=["']row spec-details__list["']"""),
+    re.compile(r"""class=["']Specs_specRow__e9Ife Specs_specDetailList__StjuR["']"""),
+)
+UL_TAG_RE = re.compile(r"<(/?)ul\b", re.IGNORECASE)
+TAG_RE = re.compile(r"<[^>]+>")
+SPACE_RE = re.compile(r"\s+")
+PRICE_DIV_RE = re.compile(r"""class=["'][^"']*\bPriceInfoText_priceInfo__QEjy8\b[^>]*>.*?<b\b[^>]*>(.*?)</b>""", re.DOTALL)
+PRICE_SPAN_RE = re.compile(r"""<span\b[^>]*class=["'][^"']*\bproduct-top-nav__font-price\b[^>]*>(.*?)</span>""", re.DOTALL)
+
+
+def normalized_text(fragment: str) -> str:
+    return SPACE_RE.sub(" ", html.unescape(TAG_RE.sub(" ", fragment))).strip()
+
+
+def spec_section(html_content: str):
+    """Source of the spec list (either layout), found by scanning for balanced <ul> tags."""
+    for marker in SPEC_LIST_MARKERS:
+        match = marker.search(html_content)
+        if match is None:
+            continue
+        start = html_content.rfind("<ul", 0, match.start())
+        depth = 0
+        for tag in UL_TAG_RE.finditer(html_content, start):
+            depth += -1 if tag.group(1) else 1
+            if depth == 0:
+                return html_content[start:tag.end()]
+        return html_content[start:]
+    return None
+
+
+def page_price(html_content: str) -> str:
+    """Price text from the PriceInfoText block, else the product-top-nav price span."""
+    match = PRICE_DIV_RE.search(html_content) or PRICE_SPAN_RE.search(html_content)
+    return normalized_text(match.group(1)) if match else ""
+
+
+def page_fingerprint(html_content: str):
+    """Hash of the normalized spec section text and price; None when the page has no spec list."""
+    section = spec_section(html_content)
+    if section is None:
+        return None
+    normalized = normalized_text(section) + "\0" + page_price(html_content)
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+class ChangeTracker:
+    """SQLite store of each product URL's fingerprint, HTTP validators and last parsed record.
+
+    Unlike ScrapeCache nothing here expires: a page whose ETag/Last-Modified
+    validators or fingerprint still match is reused no matter how old the
+    record is. Products whose specs or price differ from the previous run are
+    collected in `changes` for the run report.
+    """
+    def __init__(self, path: str):
+        self.path = path
+        self.conn = sqlite3.connect(path, timeout=30)
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS page (url TEXT PRIMARY KEY, etag TEXT, last_modified TEXT, "
+            "fingerprint TEXT, data TEXT, checked REAL)"
+        )
+        self.conn.commit()
+        self.changes = {}
+        self.new = 0
+        self.unchanged = 0
+
+    def _row(self, url: str):
+        return self.conn.execute(
+            "SELECT etag, last_modified, fingerprint, data FROM page WHERE url = ?", (url,)
+        ).fetchone()
+
+    def conditional_headers(self, url: str) -> dict:
+        """If-None-Match / If-Modified-Since headers for a conditional GET of `url`."""
+        row = self._row(url)
+        headers = {}
+        if row and row[3]:
+            if row[0]:
+                headers["If-None-Match"] = row[0]
+            if row[1]:
+                headers["If-Modified-Since"] = row[1]
+        return headers
+
+    def not_modified(self, url: str):
+        """Stored record for a URL the server answered 304 for, or None."""
+        row = self._row(url)
+        if row is None or not row[3]:
+            return None
+        self._touch(url)
+        return json.loads(row[3])
+
+    def reuse(self, url: str, fingerprint: str, etag: str = None, last_modified: str = None):
+        """Stored record if the page's fingerprint is unchanged, else None."""
+        if fingerprint is None:
+            return None
+        row = self._row(url)
+        if row is None or row[2] != fingerprint or not row[3]:
+            return None
+        self._touch(url, etag, last_modified)
+        return json.loads(row[3])
+
+    def _touch(self, url: str, etag: str = None, last_modified: str = None):
+        self.unchanged += 1
+        self.conn.execute(
+            "UPDATE page SET etag = COALESCE(?, etag), last_modified = COALESCE(?, last_modified), checked = ? WHERE url = ?",
+            (etag, last_modified, time.time(), url),
+        )
+        self.conn.commit()
+
+    def update(self, url: str, fingerprint: str, data: dict, etag: str = None, last_modified: str = None):
+        """Store a freshly parsed record, noting a change if specs or price differ from the stored one."""
+        row = self._row(url)
+        previous = json.loads(row[3]) if row and row[3] else None
+        if previous is None:
+            self.new += 1
+        elif previous.get("specifications") != data.get("specifications") or previous.get("price") != data.get("price"):
+            change = {"url": url, "skus": [], "spec_changed": previous.get("specifications") != data.get("specifications")}
+            if previous.get("price") != data.get("price"):
+                change["price"] = {"before": previous.get("price", ""), "after": data.get("price", "")}
+            self.changes[url] = change
+        else:
+            self.unchanged += 1
+        self.conn.execute(
+            "INSERT OR REPLACE INTO page (url, etag, last_modified, fingerprint, data, checked) VALUES (?, ?, ?, ?, ?, ?)",
+            (url, etag, last_modified, fingerprint, json.dumps(data), time.time()),
+        )
+        self.conn.commit()
+
+    def note_sku(self, url: str, sku: str):
+        """Attach the row's mfr number to a changed product so the report can name it."""
+        change = self.changes.get(url)
+        if change is not None and sku not in change["skus"]:
+            change["skus"].append(sku)
+
+    def report(self) -> dict:
+        return {"new": self.new, "unchanged": self.unchanged, "changed": list(self.changes.values())}
+
+    def close(self):
+        self.conn.close()
@@ -0,0 +1,143 @@
+import asyncio
+import json
+import time
+from collections import OrderedDict
+from urllib.parse import parse_qs, urlsplit
+from rich import print
+from navigation_policy import RetryableError
+from scrape_cache import ScrapeCache
+
+
+class LookupService:
+    """Long-running lookups against one warm SamsungScraper.
+
+    The browser is launched once by `start` and kept for every lookup.
+    Concurrent lookups of the same product share a single in-flight scrape,
+    and finished results are kept in an in-memory LRU (`cache_size` entries,
+    `ttl` seconds) so repeats are answered without touching the browser.
+    At most `scraper.concurrency` scrapes run at once; the rest wait their turn.
+    Retryable failures are returned but never cached.
+    """
+    def __init__(self, scraper, cache_size: int = 1024, ttl: float = 3600):
+        self.scraper = scraper
+        self.cache_size = cache_size
+        self.ttl = ttl
+        self.results = OrderedDict()
+        self.inflight = {}
+        self.semaphore = asyncio.Semaphore(scraper.concurrency)
+        self.counts = {"lookups": 0, "hits": 0, "coalesced": 0, "scrapes": 0}
+        self.server = None
+
+    async def start(self):
+        await self.scraper.launch_browser()
+        await self.scraper.navigation.goto(self.scraper.page, self.scraper.baseurl, "search")
+        # Lookups borrow pages from the pool; hand the warm-up page back to it.
+        await self.scraper.pool.release(self.scraper.page)
+        self.scraper.page = None
+        return self
+
+    async def close(self):
+        if self.server:
+            self.server.close()
+            await self.server.wait_closed()
+            self.server = None
+        await self.scraper.close_browser()
+        self.scraper.metrics.stop()
+
+    async def __aenter__(self):
+        return await self.start()
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    async def lookup(self, mfr_number: str, model_name: str = "") -> dict:
+        """Return {"status", "url", "values"} for a product; status is found, missing or retryable."""
+        self.counts["lookups"] += 1
+        key = ScrapeCache.normalize_term(model_name, mfr_number)
+        cached = self.results.get(key)
+        if cached and time.monotonic() - cached[0] < self.ttl:
+            self.results.move_to_end(key)
+            self.counts["hits"] += 1
+            return cached[1]
+        if key in self.inflight:
+            self.counts["coalesced"] += 1
+            return await asyncio.shield(self.inflight[key])
+        task = asyncio.ensure_future(self.scrape(mfr_number, model_name))
+        self.inflight[key] = task
+        try:
+            result = await asyncio.shield(task)
+        finally:
+            self.inflight.pop(key, None)
+        if result["status"] != "retryable":
+            self.results[key] = (time.monotonic(), result)
+            self.results.move_to_end(key)
+            while len(self.results) > self.cache_size:
+                self.results.popitem(last=False)
+        return result
+
+    async def scrape(self, mfr_number: str, model_name: str) -> dict:
+        async with self.semaphore:
+            self.counts["scrapes"] += 1
+            with self.scraper.metrics.stage("lookup.total", url=str(mfr_number)) as timer:
+                try:
+                    url, product_data = await self.scraper.lookup_product(mfr_number, model_name or mfr_number)
+                except RetryableError as e:
+                    timer.outcome = "retryable"
+                    return {"status": "retryable", "url": None, "values": {}, "error": e.category}
+                timer.outcome = "found" if url else "missing"
+        values = self.scraper.product_columns(product_data) if product_data else {}
+        return {"status": "found" if url else "missing", "url": url, "values": values}
+
+    def stats(self) -> dict:
+        return {**self.counts, "cached": len(self.results), "inflight": len(self.inflight)}
+
+    async def serve(self, host: str = "127.0.0.1", port: int = 8765, socket_path: str = None):
+        """Serve GET /lookup?mfr=...&model=..., /stats and /health over HTTP until cancelled.
+
+        With `socket_path` the endpoint listens on a Unix socket instead of host:port.
+        """
+        if socket_path:
+            self.server = await asyncio.start_unix_server(self.handle, path=socket_path)
+            print(f"[cyan]Lookup service listening on unix:{socket_path}[/cyan]")
+        else:
+            self.server = await asyncio.start_server(self.handle, host, port)
+            print(f"[cyan]Lookup service listening on http://{host}:{port}[/cyan]")
+        async with self.server:
+            await self.server.serve_forever()
+
+    async def handle(self, reader, writer):
+        """Answer one HTTP/1.1 request per connection with a JSON body."""
+        try:
+            request_line = (await reader.readline()).decode("latin-1").split()
+            while (await reader.readline()).strip():
+                pass  # Request headers are not needed.
+            if len(request_line) < 2 or request_line[0] != "GET":
+                status, body = 405, {"error": "only GET is supported"}
+            else:
+                status, body = await self.route(request_line[1])
+        except Exception as e:
+            status, body = 500, {"error": str(e)}
+        payload = json.dumps(body, default=str).encode("utf-8")
+        reason = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed", 500: "Internal Server Error", 503: "Service Unavailable"}[status]
+        writer.write(
+            f"HTTP/1.1 {status} {reason}\r\nContent-Type: application/json\r\n"
+            f"Content-Length: {len(payload)}\r\nConnection: close\r\n\r\n".encode("latin-1") + payload
+        )
+        try:
+            await writer.drain()
+        finally:
+            writer.close()
+
+    async def route(self, target: str):
+        parts = urlsplit(target)
+        query = {name: values[0] for name, values in parse_qs(parts.query).items()}
+        if parts.path == "/health":
+            return 200, {"status": "ok"}
+        if parts.path == "/stats":
+            return 200, self.stats()
+        if parts.path != "/lookup":
+            return 404, {"error": f"unknown path {parts.path}"}
+        if not query.get("mfr"):
+            return 400, {"error": "the mfr query parameter is required"}
+        result = await self.lookup(query["mfr"], query.get("model", ""))
+        return (503 if result["status"] == "retryable" else 200), result
@@ -0,0 +1,82 @@
+import bisect
+import re
+from collections import defaultdict
+
+
+# Match tiers, best first.
+EXACT, VARIANT, PREFIX = 0, 1, 2
+# Shortest code that may match as a prefix; shorter ones are model families, not models.
+MIN_PREFIX = 6
+NON_CODE_RE = re.compile(r"[^A-Z0-9/]")
+
+
+def normalize_code(code: str):
+    """(full, base) forms of a model code: uppercase alphanumerics, with and without
+    the regional suffix after "/" (e.g. "qn65q80c/za" -> ("QN65Q80CZA", "QN65Q80C"))."""
+    cleaned = NON_CODE_RE.sub("", str(code or "").upper())
+    base = cleaned.split("/", 1)[0]
+    return cleaned.replace("/", ""), base
+
+
+class ModelIndex:
+    """Search result cards indexed by normalized model code.
+
+    `match` ranks candidates for an mfr number: an exact code, then the same
+    model with a different regional suffix ("/ZA" vs "/AA"), then a code that
+    is a prefix of the other (at least MIN_PREFIX characters). Within a tier the
+    longest shared code wins, then the closest length, then the code itself,
+    so the result never depends on card order.
+    """
+    def __init__(self, cards=()):
+        self.full = {}
+        self.base = defaultdict(list)
+        for code, href in cards:
+            if not code or not href:
+                continue
+            full, base = normalize_code(code)
+            if not full or full in self.full:
+                continue
+            self.full[full] = (code, href)
+            self.base[base].append(full)
+        self.sorted_codes = sorted(self.full)
+
+    def __len__(self):
+        return len(self.full)
+
+    def candidates(self, mfr_number: str):
+        """Yield (tier, shared_length, full_code) for every card that could be the mfr number."""
+        full, base = normalize_code(mfr_number)
+        if not full:
+            return
+        if full in self.full:
+            yield EXACT, len(full), full
+        for code in self.base.get(base, ()):
+            if code != full:
+                yield VARIANT, len(base), code
+        # Card codes that are a prefix of the mfr number ...
+        for length in range(MIN_PREFIX, len(full)):
+            if full[:length] in self.full:
+                yield PREFIX, length, full[:length]
+        # ... and card codes the mfr number is a prefix of.
+        if len(full) >= MIN_PREFIX:
+            position = bisect.bisect_right(self.sorted_codes, full)
+            while position < len(self.sorted_codes) and self.sorted_codes[position].startswith(full):
+                yield PREFIX, len(full), self.sorted_codes[position]
+                position += 1
+
+    def match(self, mfr_number: str):
+        """Best (tier, code, href) for the mfr number, or None."""
+        full = normalize_code(mfr_number)[0]
+        ranked = sorted(
+            self.candidates(mfr_number),
+            key=lambda candidate: (candidate[0], -candidate[1], abs(len(candidate[2]) - len(full)), candidate[2]),
+        )
+        if not ranked:
+            return None
+        tier, _, code = ranked[0]
+        return (tier, *self.full[code])
+
+    def best(self, mfr_number: str):
+        """href of the best matching card, or None."""
+        found = self.match(mfr_number)
+        return found[2] if found else None
@@ -0,0 +1,193 @@
+import asyncio
+import random
+import sys
+import time
+from collections import deque
+from urllib.parse import urlparse
+from rich import print
+
+
+# Status codes samsung.com (behind Akamai) answers with when it is throttling us.
+THROTTLE_STATUSES = {403, 429, 503}
+NETWORK_ERROR_MARKERS = ("net::ERR_", "Navigation failed", "Target closed", "Target page, context or browser has been closed", "crashed")
+
+
+class ThrottledError(Exception):
+    """The site answered with a throttling status."""
+    def __init__(self, url: str, status: int):
+        super().__init__(f"HTTP {status} for {url}")
+        self.status = status
+
+
+class RetryableError(Exception):
+    """A retryable failure that persisted through every attempt."""
+    def __init__(self, kind: str, target: str, category: str, cause: Exception):
+        super().__init__(f"{kind} {target!r} failed after retries ({category}): {cause}")
+        self.category = category
+        self.cause = cause
+
+
+def classify(error: Exception) -> str:
+    """'throttled', 'timeout' and 'network' are retryable; anything else is 'fatal'.
+
+    Playwright and httpx are looked up in sys.modules rather than imported: an
+    error can only come from them once the scraper has loaded them.
+    """
+    if isinstance(error, ThrottledError):
+        return "throttled"
+    if isinstance(error, asyncio.TimeoutError):
+        return "timeout"
+    playwright = sys.modules.get("playwright.async_api")
+    if playwright is not None and isinstance(error, playwright.TimeoutError):
+        return "timeout"
+    httpx = sys.modules.get("httpx")
+    if httpx is not None:
+        if isinstance(error, httpx.TimeoutException):
+            return "timeout"
+        if isinstance(error, httpx.TransportError):
+            return "network"
+    if playwright is not None and isinstance(error, playwright.Error) and any(marker in str(error) for marker in NETWORK_ERROR_MARKERS):
+        return "network"
+    return "fatal"
+
+
+class TokenBucket:
+    """Per-host token bucket whose rate adapts AIMD-style: it creeps up after each
+    success and halves on throttling, settling near the highest rate the host accepts."""
+    def __init__(self, rate: float = 2.0, burst: float = 4.0, min_rate: float = 0.2, max_rate: float = 16.0, increase: float = 0.05):
+        self.rate = rate
+        self.burst = burst
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.increase = increase
+        self.tokens = burst
+        self.updated = time.monotonic()
+        self.lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self.lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+    def success(self):
+        self.rate = min(self.max_rate, self.rate + self.increase)
+
+    def throttled(self):
+        self.rate = max(self.min_rate, self.rate / 2)
+        self.tokens = 0
+
+
+class AdaptiveTimeout:
+    """Navigation timeout derived from the p95 of recent successful navigations."""
+    def __init__(self, initial: float = 30.0, minimum: float = 10.0, maximum: float = 120.0,
+                 multiplier: float = 3.0, window: int = 200, min_samples: int = 20):
+        self.initial = initial
+        self.minimum = minimum
+        self.maximum = maximum
+        self.multiplier = multiplier
+        self.min_samples = min_samples
+        self.samples = deque(maxlen=window)
+
+    def observe(self, seconds: float):
+        self.samples.append(seconds)
+
+    def current(self) -> float:
+        if len(self.samples) < self.min_samples:
+            return self.initial
+        ordered = sorted(self.samples)
+        p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+        return max(self.minimum, min(self.maximum, p95 * self.multiplier))
+
+
+class NavigationPolicy:
+    """Timeouts, retries and rate control for every navigation the scraper makes.
+
+    `goto`/`get` wait for the host's token bucket, apply the adaptive timeout for
+    their kind ("search", "product", ...) and raise ThrottledError on throttling
+    statuses. `retry` re-runs an attempt on retryable failures with full-jitter
+    exponential backoff and raises RetryableError once attempts run out.
+    """
+    def __init__(self, metrics=None, max_attempts: int = 4, backoff_base: float = 1.0, backoff_cap: float = 30.0, **bucket_options):
+        self.metrics = metrics
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.bucket_options = bucket_options
+        self.buckets = {}
+        self.timeouts = {}
+
+    def bucket(self, url: str, channel: str = "browser") -> TokenBucket:
+        """Token bucket for the url's host; browser and plain HTTP traffic are limited separately."""
+        key = f"{channel}:{urlparse(url).hostname or ''}"
+        if key not in self.buckets:
+            self.buckets[key] = TokenBucket(**self.bucket_options)
+        return self.buckets[key]
+
+    def timeout(self, kind: str) -> AdaptiveTimeout:
+        if kind not in self.timeouts:
+            self.timeouts[kind] = AdaptiveTimeout()
+        return self.timeouts[kind]
+
+    async def goto(self, page, url: str, kind: str):
+        """Rate-limited page.goto with the adaptive timeout for `kind`."""
+        bucket = self.bucket(url)
+        await bucket.acquire()
+        timeout = self.timeout(kind)
+        start = time.perf_counter()
+        response = await page.goto(url, timeout=timeout.current() * 1000)
+        if response is not None and response.status in THROTTLE_STATUSES:
+            bucket.throttled()
+            raise ThrottledError(url, response.status)
+        timeout.observe(time.perf_counter() - start)
+        bucket.success()
+        return response
+
+    async def get(self, client, url: str, kind: str, headers: dict = None):
+        """Rate-limited HTTP GET with the adaptive timeout for `kind`.
+
+        Only 429/503 count as throttling here: bot protection commonly answers plain
+        HTTP clients with 403, which just means "use the browser".
+        """
+        bucket = self.bucket(url, channel="http")
+        await bucket.acquire()
+        timeout = self.timeout(kind)
+        start = time.perf_counter()
+        response = await client.get(url, timeout=timeout.current(), headers=headers)
+        if response.status_code in (429, 503):
+            bucket.throttled()
+            raise ThrottledError(url, response.status_code)
+        timeout.observe(time.perf_counter() - start)
+        bucket.success()
+        return response
+
+    async def retry(self, kind: str, target: str, attempt):
+        """Await `attempt()` until it succeeds, retrying retryable failures with backoff."""
+        for number in range(1, self.max_attempts + 1):
+            try:
+                return await attempt()
+            except Exception as e:
+                category = classify(e)
+                if category == "fatal":
+                    raise
+                if number == self.max_attempts:
+                    raise RetryableError(kind, target, category, e) from e
+                if self.metrics:
+                    # Counted against the stage that wraps the whole attempt, e.g. "search.total".
+                    self.metrics.retry(f"{kind}.total")
+                delay = random.uniform(0, min(self.backoff_cap, self.backoff_base * 2 ** (number - 1)))
+                if category == "throttled":
+                    delay += self.backoff_base * 2 ** number
+                print(f"[yellow]{kind} {target}: {category}, retrying in {delay:.1f}s ({number}/{self.max_attempts - 1})[/yellow]")
+                await asyncio.sleep(delay)
+
+    def stats(self) -> dict:
+        return {
+            "rates": {host: round(bucket.rate, 2) for host, bucket in self.buckets.items()},
+            "timeouts_s": {kind: round(timeout.current(), 1) for kind, timeout in self.timeouts.items()},
+        }
@@ -0,0 +1,346 @@
+import importlib.util
+from rich import print
+
+# lxml is optional (without it only the BeautifulSoup backend is available) and,
+# like bs4, is imported by the backend that uses it rather than with this module.
+HAS_LXML = importlib.util.find_spec("lxml") is not None
+
+
+def empty_fields():
+    return {"image": "", "price": "", "description": "", "specifications": {}, "spec_pdf": ""}
+
+
+class SoupParser:
+    """Reference backend: BeautifulSoup with the pure-Python html.parser."""
+    name = "bs4"
+
+    def parse(self, html_content: str):
+        """Extract specifications, image, description, price and spec pdf from a product page."""
+        from bs4 import BeautifulSoup
+        data = empty_fields()
+        specifications = {}
+
+        #Extract Specificatiobns
+        try:
+            soup = BeautifulSoup(html_content, 'html.parser')
+            spec_groups_ul = soup.find("ul", class_ = "row spec-details__list")
+            if spec_groups_ul:
+                spec_li = spec_groups_ul.find_all("li", itemscope=True)
+
+                for section in spec_li:
+                    category_name_elem = section.find('span', itemprop='name')
+
+                    # Check if the category name exists
+                    if category_name_elem:
+                        category = category_name_elem.text.strip()
+                        specifications[category] = {}
+
+                        # Find all spec items within the section
+                        spec_items = section.find_all('div', class_='sub-specs__item')
+
+                        for item in spec_items:
+                            # Extract key and value from each spec item
+                            key_elem = item.find('span', class_='specs-item-name')
+                            value_elem = item.find('p', class_='sub-specs__item__value')
+
+                            if key_elem and value_elem:
+                                key = key_elem.text.strip()
+                                value = value_elem.text.strip()
+                                specifications[category][key] = value
+                            else:
+                                print(f"Missing key/value in item: {item}")
+                    else:
+                        print("Category name missing for section:", section)
+            else:
+                spec_groups_ul = soup.find("ul", class_ = "Specs_specRow__e9Ife Specs_specDetailList__StjuR")
+                if spec_groups_ul:
+                    spec_li = spec_groups_ul.find_all("li")
+
+                    for section in spec_li:
+                        category_name_elem = section.find('figcaption')
+
+                        # Check if the category name exists
+                        if category_name_elem:
+                            category = category_name_elem.text.strip()
+                            specifications[category] = {}
+
+                            # Find all spec items within the section
+                            spec_items = section.find_all('div', class_='subSpecsItem')
+
+                            for item in spec_items:
+                                # Extract key and value from each spec item
+                                key_elem = item.find('div', class_='Specs_subSpecItemName__IUPV4')
+                                value_elem = item.find('div', class_='Specs_subSpecsItemValue__oWnMq')
+
+                                if key_elem and value_elem:
+                                    key = key_elem.text.strip()
+                                    value = value_elem.text.strip()
+                                    specifications[category][key] = value
+                                else:
+                                    print(f"Missing key/value in item: {item}")
+                        else:
+                            print("Category name missing for section:", section)
+                else:
+                    print("Specification groups not found.")
+
+            data["specifications"] = specifications
+        except Exception as e:
+            print(f"Error extracting image: {e}")
+
+        # Extract Product Image (jpg)
+        try:
+            image_locators =soup.find_all("img")
+            if image_locators:
+                for item in image_locators:
+                    src = item.get("src")
+                    if src and src.startswith("https://image-us.samsung.com") and ".png" not in src:
+                        data["image"] = src.replace("$", "")
+                        break
+            else:
+                print("Product Image Not  found ")
+        except Exception as e:
+            print(f"Error extracting image: {e}")
+
+        # Extract Product Description
+        try:
+            description_locator = soup.find("ul", class_ = "product-details__info-description")
+            if description_locator:
+                data["description"] = description_locator.get_text().replace("\n", "").replace("\t", "")
+            else:
+                description_locator = soup.find("div", class_ = "ProductSummary_detailList__zDn4_" )
+                if description_locator:
+                    data["description"] = description_locator.get_text().replace("\n", "").replace("\t", "")
+        except Exception as e:
+            print(f"Error extracting description: {e}")
+
+        # Extract Price
+        try:
+            price_div = soup.find("div", class_="PriceInfoText_priceInfo__QEjy8")
+            if price_div:
+                price_tag = price_div.find("b")  # Find the bold price text
+                if price_tag:
+                    data["price"] = price_tag.text.strip()
+                else:
+                    print("Price not found inside <b> tag.")
+            else:
+                price_span = soup.find("span", class_ = "product-top-nav__font-price")
+                if price_span:
+                    data["price"] = price_span.get_text(strip=True)
+                else:
+                    print("Price div not found.")
+        except Exception as e:
+            print(f"Error extracting price: {e}")
+
+        #Extract Specification pdf download link
+        try:
+            spec_pdf_div = soup.find('div', class_ = "span-sm-2 span-lg-2 spec-download")
+            if spec_pdf_div:
+                data["spec_pdf"] = spec_pdf_div.find("a").get("href")
+        except Exception as e:
+            print(f"Error extracting spec_pdf: {e}")
+
+        return data
+
+
+def class_xpath(tag: str, class_name: str):
+    """XPath matching `tag` elements that carry `class_name` as one of their classes."""
+    return f"{tag}[contains(concat(' ', normalize-space(@class), ' '), ' {class_name} ')]"
+
+
+class LxmlParser:
+    """lxml backend: one pass over the document to find every anchor element, then
+    precompiled XPath lookups inside those anchors. Produces the same fields as SoupParser."""
+    name = "lxml"
+
+    # Whole-attribute class matches, mirroring BeautifulSoup's multi-word class_ lookups.
+    LEGACY_SPEC_LIST = "row spec-details__list"
+    MODULE_SPEC_LIST = "Specs_specRow__e9Ife Specs_specDetailList__StjuR"
+    SPEC_PDF = "span-sm-2 span-lg-2 spec-download"
+    # Single-class matches.
+    DESCRIPTION_LIST = "product-details__info-description"
+    DESCRIPTION_DIV = "ProductSummary_detailList__zDn4_"
+    PRICE_DIV = "PriceInfoText_priceInfo__QEjy8"
+    PRICE_SPAN = "product-top-nav__font-price"
+
+    def __init__(self):
+        try:
+            from lxml import etree, html as lxml_html
+        except ImportError as e:
+            raise ImportError("lxml is required for the lxml parser backend") from e
+        self.etree = etree
+        self.lxml_html = lxml_html
+        self.legacy_sections = etree.XPath(".//li[@itemscope]")
+        self.legacy_category = etree.XPath(".//span[@itemprop='name']")
+        self.legacy_items = etree.XPath(".//" + class_xpath("div", "sub-specs__item"))
+        self.legacy_key = etree.XPath(".//" + class_xpath("span", "specs-item-name"))
+        self.legacy_value = etree.XPath(".//" + class_xpath("p", "sub-specs__item__value"))
+        self.module_sections = etree.XPath(".//li")
+        self.module_category = etree.XPath(".//figcaption")
+        self.module_items = etree.XPath(".//" + class_xpath("div", "subSpecsItem"))
+        self.module_key = etree.XPath(".//" + class_xpath("div", "Specs_subSpecItemName__IUPV4"))
+        self.module_value = etree.XPath(".//" + class_xpath("div", "Specs_subSpecsItemValue__oWnMq"))
+        self.bold = etree.XPath(".//b")
+        self.link = etree.XPath(".//a")
+        # Like BeautifulSoup's get_text(), leave out script, style and template contents.
+        self.strings = etree.XPath(
+            ".//text()[not(ancestor::script) and not(ancestor::style) and not(ancestor::template)]"
+        )
+        # lxml closes a <p> at the first block element inside it, which html.parser doesn't;
+        # a value <p> directly followed by a block sibling may have been split that way.
+        self.split_values = etree.XPath(
+            ".//" + class_xpath("p", "sub-specs__item__value")
+            + "/following-sibling::*[1][self::div or self::p or self::ul or self::ol or self::table or self::section]"
+        )
+
+    def text(self, element):
+        return "".join(self.strings(element))
+
+    @staticmethod
+    def first(xpath, element):
+        found = xpath(element)
+        return found[0] if found else None
+
+    def locate(self, root):
+        """Single traversal collecting the first element of every kind the parser needs."""
+        anchors = {}
+        image = None
+        has_images = False
+        for element in root.iter("ul", "div", "span", "img"):
+            tag = element.tag
+            if tag == "img":
+                has_images = True
+                if image is None:
+                    src = element.get("src")
+                    if src and src.startswith("https://image-us.samsung.com") and ".png" not in src:
+                        image = src
+                continue
+            class_attr = element.get("class")
+            if not class_attr:
+                continue
+            classes = class_attr.split()
+            joined = " ".join(classes)
+            if tag == "ul":
+                if joined == self.LEGACY_SPEC_LIST:
+                    anchors.setdefault("legacy_specs", element)
+                elif joined == self.MODULE_SPEC_LIST:
+                    anchors.setdefault("module_specs", element)
+                if self.DESCRIPTION_LIST in classes:
+                    anchors.setdefault("description_list", element)
+            elif tag == "div":
+                if joined == self.SPEC_PDF:
+                    anchors.setdefault("spec_pdf", element)
+                if self.PRICE_DIV in classes:
+                    anchors.setdefault("price_div", element)
+                if self.DESCRIPTION_DIV in classes:
+                    anchors.setdefault("description_div", element)
+            elif self.PRICE_SPAN in classes:
+                anchors.setdefault("price_span", element)
+        return anchors, image, has_images
+
+    def parse_sections(self, spec_list, sections, category_xpath, items_xpath, key_xpath, value_xpath):
+        specifications = {}
+        for section in sections(spec_list):
+            category_name_elem = self.first(category_xpath, section)
+            if category_name_elem is None:
+                print("Category name missing for section:", self.etree.tostring(section, encoding="unicode"))
+                continue
+            category = self.text(category_name_elem).strip()
+            specifications[category] = {}
+            for item in items_xpath(section):
+                key_elem = self.first(key_xpath, item)
+                value_elem = self.first(value_xpath, item)
+                if key_elem is not None and value_elem is not None:
+                    specifications[category][self.text(key_elem).strip()] = self.text(value_elem).strip()
+                else:
+                    print(f"Missing key/value in item: {self.etree.tostring(item, encoding='unicode')}")
+        return specifications
+
+    def parse(self, html_content: str):
+        """Extract specifications, image, description, price and spec pdf from a product page."""
+        data = empty_fields()
+        try:
+            root = self.lxml_html.document_fromstring(html_content)
+        except self.etree.ParserError as e:
+            print(f"Error parsing page: {e}")
+            return data
+        except ValueError:
+            # lxml rejects str input that starts with an XML encoding declaration; html.parser doesn't.
+            return SoupParser().parse(html_content)
+        anchors, image, has_images = self.locate(root)
+        if "legacy_specs" in anchors and self.split_values(anchors["legacy_specs"]):
+            # The tree can't tell which text belonged inside the value, so use the reference backend.
+            return SoupParser().parse(html_content)
+
+        if "legacy_specs" in anchors:
+            data["specifications"] = self.parse_sections(
+                anchors["legacy_specs"], self.legacy_sections, self.legacy_category,
+                self.legacy_items, self.legacy_key, self.legacy_value,
+            )
+        elif "module_specs" in anchors:
+            data["specifications"] = self.parse_sections(
+                anchors["module_specs"], self.module_sections, self.module_category,
+                self.module_items, self.module_key, self.module_value,
+            )
+        else:
+            print("Specification groups not found.")
+
+        if image:
+            data["image"] = image.replace("$", "")
+        elif not has_images:
+            print("Product Image Not  found ")
+
+        description = anchors.get("description_list")
+        if description is None:
+            description = anchors.get("description_div")
+        if description is not None:
+            data["description"] = self.text(description).replace("\n", "").replace("\t", "")
+
+        if "price_div" in anchors:
+            price_tag = self.first(self.bold, anchors["price_div"])
+            if price_tag is not None:
+                data["price"] = self.text(price_tag).strip()
+            else:
+                print("Price not found inside <b> tag.")
+        elif "price_span" in anchors:
+            data["price"] = "".join(s.strip() for s in self.strings(anchors["price_span"]) if s.strip())
+        else:
+            print("Price div not found.")
+
+        if "spec_pdf" in anchors:
+            link = self.first(self.link, anchors["spec_pdf"])
+            if link is not None:
+                data["spec_pdf"] = link.get("href")
+            else:
+                print("Spec pdf link not found")
+
+        return data
+
+
+PARSERS = {"bs4": SoupParser, "lxml": LxmlParser}
+
+
+def backend_name(name: str = None):
+    """Validated backend name; defaults to lxml when it is installed."""
+    if name is None:
+        name = "lxml" if HAS_LXML else "bs4"
+    if name not in PARSERS:
+        raise ValueError(f"Unknown parser backend {name!r}, expected one of {sorted(PARSERS)}")
+    return name
+
+
+def get_parser(name: str = None):
+    """Return a parser backend by name; defaults to lxml when it is installed."""
+    return PARSERS[backend_name(name)]()
+
+
+_process_parsers = {}
+
+
+def parse_with(name: str, html_content: str):
+    """Parse with the named backend, reusing one parser per process.
+
+    Module-level so it can be sent to a ProcessPoolExecutor worker.
+    """
+    if name not in _process_parsers:
+        _process_parsers[name] = get_parser(name)
+    return _process_parsers[name].parse(html_content)
@@ -0,0 +1,101 @@
+from collections import Counter
+from urllib.parse import urlparse
+from rich import print
+
+
+DEFAULT_BLOCKED_TYPES = ("image", "media", "font")
+DEFAULT_BLOCKED_DOMAINS = (
+    "google-analytics.com",
+    "googletagmanager.com",
+    "doubleclick.net",
+    "googlesyndication.com",
+    "facebook.net",
+    "facebook.com",
+    "adobedtm.com",
+    "demdex.net",
+    "omtrdc.net",
+    "everesttech.net",
+    "hotjar.com",
+    "quantummetric.com",
+    "criteo.com",
+    "criteo.net",
+    "bing.com",
+    "tiktok.com",
+    "analytics.tiktok.com",
+    "pinterest.com",
+    "snapchat.com",
+    "twitter.com",
+    "linkedin.com",
+    "clarity.ms",
+)
+# Rough transfer size of a blocked request, per resource type. Blocked requests are
+# never downloaded, so bytes saved can only be estimated.
+ESTIMATED_BYTES = {
+    "image": 150_000,
+    "media": 2_000_000,
+    "font": 60_000,
+    "script": 80_000,
+    "stylesheet": 40_000,
+}
+DEFAULT_ESTIMATED_BYTES = 20_000
+
+
+def host_matches(host: str, domains) -> bool:
+    """True if host is one of domains or a subdomain of one."""
+    return any(host == domain or host.endswith("." + domain) for domain in domains)
+
+
+class ResourcePolicy:
+    """Route-interception policy that aborts requests the scraper does not need.
+
+    A request is blocked when its resource type or host is on a deny list, unless
+    its type or host is on the matching allow list. Allow lists always win.
+    """
+    def __init__(self, blocked_types=DEFAULT_BLOCKED_TYPES, blocked_domains=DEFAULT_BLOCKED_DOMAINS,
+                 allowed_types=(), allowed_domains=()):
+        self.blocked_types = set(blocked_types)
+        self.blocked_domains = tuple(blocked_domains)
+        self.allowed_types = set(allowed_types)
+        self.allowed_domains = tuple(allowed_domains)
+        self.blocked = Counter()
+        self.allowed = 0
+
+    def should_block(self, resource_type: str, url: str) -> bool:
+        host = (urlparse(url).hostname or "").lower()
+        if resource_type in self.allowed_types or host_matches(host, self.allowed_domains):
+            return False
+        return resource_type in self.blocked_types or host_matches(host, self.blocked_domains)
+
+    async def handle_route(self, route):
+        request = route.request
+        if self.should_block(request.resource_type, request.url):
+            self.blocked[request.resource_type] += 1
+            await route.abort()
+        else:
+            self.allowed += 1
+            await route.continue_()
+
+    async def install(self, context):
+        """Attach the policy to every page of a browser context."""
+        await context.route("**/*", self.handle_route)
+
+    def report(self) -> dict:
+        """Blocked request counts per type and the estimated bytes they would have cost."""
+        estimated_bytes = sum(
+            count * ESTIMATED_BYTES.get(resource_type, DEFAULT_ESTIMATED_BYTES)
+            for resource_type, count in self.blocked.items()
+        )
+        return {
+            "blocked_requests": sum(self.blocked.values()),
+            "blocked_by_type": dict(self.blocked),
+            "allowed_requests": self.allowed,
+            "estimated_bytes_saved": estimated_bytes,
+        }
+
+    def print_report(self):
+        report = self.report()
+        print(
+            f"[cyan]Blocked {report['blocked_requests']} requests "
+            f"(~{report['estimated_bytes_saved'] / 1_000_000:.1f} MB saved), "
+            f"allowed {report['allowed_requests']}[/cyan]"
+        )
@@ -0,0 +1,127 @@
+import csv
+import os
+from openpyxl import Workbook, load_workbook
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # optional: only needed for Parquet input/output
+    pa = pq = None
+
+
+def file_format(path: str) -> str:
+    extension = os.path.splitext(path)[1].lower()
+    formats = {".xlsx": "xlsx", ".xlsm": "xlsx", ".csv": "csv", ".parquet": "parquet"}
+    if extension not in formats:
+        raise ValueError(f"Unsupported file type {extension!r} for {path}, expected .xlsx, .csv or .parquet")
+    if formats[extension] == "parquet" and pq is None:
+        raise ImportError("pyarrow is required for Parquet input/output")
+    return formats[extension]
+
+
+def read_header(path: str, sheet_name: str = "Grainger"):
+    """Column names of the input file, in order."""
+    for header, _ in iter_rows(path, sheet_name, batch_size=1, header_only=True):
+        return header
+    return []
+
+
+def iter_rows(path: str, sheet_name: str = "Grainger", batch_size: int = 200, header_only: bool = False):
+    """Yield (header, batch) pairs where batch is a list of (row_number, {column: value}).
+
+    Rows are read lazily (openpyxl read-only mode, csv reader or Parquet record
+    batches), so at most `batch_size` rows are held in memory at a time.
+    Row numbers count data rows from 0, like a default DataFrame index; rows
+    with no values at all are skipped but still counted.
+    """
+    kind = file_format(path)
+    if kind == "xlsx":
+        workbook = load_workbook(path, read_only=True, data_only=True)
+        try:
+            rows = workbook[sheet_name].iter_rows(values_only=True)
+            header = list(next(rows, ()))
+            # Sheets often carry formatted but empty trailing columns; name the rest like pandas does.
+            while header and header[-1] is None:
+                header.pop()
+            header = [f"Unnamed: {i}" if c is None else str(c) for i, c in enumerate(header)]
+            records = (dict(zip(header, values)) for values in rows)
+            yield from _batched(header, records, batch_size, header_only)
+        finally:
+            workbook.close()
+    elif kind == "csv":
+        with open(path, newline="", encoding="utf-8") as f:
+            reader = csv.DictReader(f)
+            header = list(reader.fieldnames or [])
+            yield from _batched(header, reader, batch_size, header_only)
+    else:
+        parquet = pq.ParquetFile(path)
+        header = parquet.schema_arrow.names
+
+        def records():
+            for record_batch in parquet.iter_batches(batch_size=batch_size):
+                yield from record_batch.to_pylist()
+
+        yield from _batched(header, records(), batch_size, header_only)
+
+
+def _batched(header, records, batch_size: int, header_only: bool):
+    if header_only:
+        yield header, []
+        return
+    batch = []
+    for row_number, record in enumerate(records):
+        if all(value is None or value == "" for value in record.values()):
+            continue
+        batch.append((row_number, record))
+        if len(batch) >= batch_size:
+            yield header, batch
+            batch = []
+    if batch:
+        yield header, batch
+
+
+class RowWriter:
+    """Write-only sink for enriched rows: .xlsx (openpyxl write-only), .csv or .parquet.
+
+    Rows are appended in batches and never kept after they are written.
+    """
+    def __init__(self, path: str, columns, sheet_name: str = "Grainger"):
+        self.path = path
+        self.columns = list(columns)
+        self.kind = file_format(path)
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        if self.kind == "xlsx":
+            self.workbook = Workbook(write_only=True)
+            self.sheet = self.workbook.create_sheet(sheet_name)
+            self.sheet.append(self.columns)
+        elif self.kind == "csv":
+            self.file = open(path, "w", newline="", encoding="utf-8")
+            self.writer = csv.writer(self.file)
+            self.writer.writerow(self.columns)
+        else:
+            # Column types vary row to row in the workbook, so Parquet output is all strings.
+            self.schema = pa.schema([(column, pa.string()) for column in self.columns])
+            self.writer = pq.ParquetWriter(path, self.schema)
+
+    def write(self, rows):
+        """Append a batch of {column: value} dicts."""
+        if self.kind == "xlsx":
+            for row in rows:
+                self.sheet.append([row.get(column) for column in self.columns])
+        elif self.kind == "csv":
+            self.writer.writerows([["" if row.get(column) is None else row.get(column) for column in self.columns] for row in rows])
+        else:
+            table = pa.table(
+                {column: [None if row.get(column) is None else str(row.get(column)) for row in rows] for column in self.columns},
+                schema=self.schema,
+            )
+            self.writer.write_table(table)
+
+    def close(self):
+        if self.kind == "xlsx":
+            self.workbook.save(self.path)
+        elif self.kind == "csv":
+            self.file.close()
+        else:
+            self.writer.close()
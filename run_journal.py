@@ -0,0 +1,70 @@
+import json
+import os
+
+
+def read_journal(path: str):
+    """{index: entry} for every row in the journal at `path`; later lines win."""
+    entries = {}
+    if not os.path.exists(path):
+        return entries
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            entries[entry["index"]] = entry
+    return entries
+
+
+class RunJournal:
+    """Append-only JSONL journal of completed rows, keyed by DataFrame index.
+
+    Each line is one finished row: {"index": ..., "status": "found" | "missing" | "retryable" | "error", "values": {column: value}}.
+    A crash can at worst leave a truncated last line; `load` skips it and resuming
+    truncates it before appending.
+    """
+    def __init__(self, path: str, resume: bool = False):
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.entries = self.load() if resume else {}
+        if resume:
+            self.drop_partial_line()
+        self.file = open(path, "a" if resume else "w", encoding="utf-8")
+
+    def drop_partial_line(self):
+        """Truncate a line left half-written by a crash, so the next append starts on a fresh line."""
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, "rb+") as f:
+            end = f.seek(0, os.SEEK_END)
+            position = end
+            # Scan back from the end for the last newline, a block at a time.
+            while position > 0:
+                start = max(0, position - 4096)
+                f.seek(start)
+                block = f.read(position - start)
+                newline = block.rfind(b"\n")
+                if newline != -1:
+                    position = start + newline + 1
+                    break
+                position = start
+            if position < end:
+                f.truncate(position)
+
+    def load(self):
+        """Read the journal back into {index: entry}; later lines win."""
+        return read_journal(self.path)
+
+    def append(self, index, status: str, values: dict):
+        if hasattr(index, "item"):
+            index = index.item()
+        entry = {"index": index, "status": status, "values": values}
+        self.file.write(json.dumps(entry, default=str) + "\n")
+        self.file.flush()
+        self.entries[index] = entry
+
+    def close(self):
+        self.file.close()
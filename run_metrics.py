@@ -0,0 +1,189 @@
+import csv
+import heapq
+import json
+import threading
+import time
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+# Upper bounds (seconds) of the latency histogram buckets; the last bucket is +Inf.
+HISTOGRAM_BUCKETS = (0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120)
+SLOWEST_URLS = 20
+
+
+def percentile(ordered, pct: float):
+    if not ordered:
+        return 0.0
+    position = (len(ordered) - 1) * pct / 100
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+class StageTimer:
+    """Handle yielded by RunMetrics.stage; set `outcome` and `bytes` before it closes."""
+    def __init__(self):
+        self.outcome = "ok"
+        self.bytes = 0
+
+
+class RunMetrics:
+    """Per-stage durations, outcomes, retries and bytes for one scraper run.
+
+    Stages are dotted names such as "search.goto" or "product.parse". `report`
+    writes <prefix>.json (summaries, histograms, slowest URLs) and <prefix>.csv,
+    plus <prefix>.prom in OpenMetrics text format when asked; `serve` exposes the
+    same OpenMetrics text over HTTP while the run is in progress.
+    """
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.durations = defaultdict(list)
+        self.outcomes = defaultdict(Counter)
+        self.retries = Counter()
+        self.bytes = Counter()
+        self.slowest = []
+        self.started = time.time()
+        self.extra = {}
+        self.server = None
+
+    @contextmanager
+    def stage(self, name: str, url: str = None):
+        """Time the enclosed block; an exception is recorded as outcome "error" and re-raised."""
+        timer = StageTimer()
+        start = time.perf_counter()
+        try:
+            yield timer
+        except BaseException:
+            timer.outcome = "error"
+            raise
+        finally:
+            self.record(name, time.perf_counter() - start, timer.outcome, url=url, size=timer.bytes)
+
+    def record(self, name: str, seconds: float, outcome: str = "ok", url: str = None, size: int = 0):
+        with self.lock:
+            self.durations[name].append(seconds)
+            self.outcomes[name][outcome] += 1
+            self.bytes[name] += size
+            if url:
+                entry = (seconds, name, url)
+                if len(self.slowest) < SLOWEST_URLS:
+                    heapq.heappush(self.slowest, entry)
+                else:
+                    heapq.heappushpop(self.slowest, entry)
+
+    def retry(self, name: str):
+        with self.lock:
+            self.retries[name] += 1
+
+    def summary(self) -> dict:
+        with self.lock:
+            stages = {}
+            for name, samples in sorted(self.durations.items()):
+                ordered = sorted(samples)
+                buckets = Counter()
+                for seconds in ordered:
+                    bound = next((b for b in HISTOGRAM_BUCKETS if seconds <= b), "+Inf")
+                    buckets[str(bound)] += 1
+                stages[name] = {
+                    "count": len(ordered),
+                    "total_s": sum(ordered),
+                    "mean_s": sum(ordered) / len(ordered),
+                    "p50_s": percentile(ordered, 50),
+                    "p95_s": percentile(ordered, 95),
+                    "max_s": ordered[-1],
+                    "outcomes": dict(self.outcomes[name]),
+                    "retries": self.retries[name],
+                    "bytes": self.bytes[name],
+                    "histogram": {str(b): buckets[str(b)] for b in HISTOGRAM_BUCKETS + ("+Inf",)},
+                }
+            slowest = [
+                {"seconds": seconds, "stage": name, "url": url}
+                for seconds, name, url in sorted(self.slowest, reverse=True)
+            ]
+            return {
+                "started": self.started,
+                "elapsed_s": time.time() - self.started,
+                "stages": stages,
+                "retries": dict(self.retries),
+                "slowest_urls": slowest,
+                **self.extra,
+            }
+
+    def openmetrics(self) -> str:
+        """Render cumulative histograms and counters in OpenMetrics text format."""
+        lines = [
+            "# TYPE samsung_scraper_stage_seconds histogram",
+            "# HELP samsung_scraper_stage_seconds Duration of scraper stages.",
+        ]
+        with self.lock:
+            items = sorted((name, list(samples)) for name, samples in self.durations.items())
+            outcomes = {name: dict(counter) for name, counter in self.outcomes.items()}
+            retries = dict(self.retries)
+            sizes = dict(self.bytes)
+        for name, samples in items:
+            cumulative = 0
+            for bound in HISTOGRAM_BUCKETS:
+                cumulative = sum(1 for s in samples if s <= bound)
+                lines.append(f'samsung_scraper_stage_seconds_bucket{{stage="{name}",le="{bound}"}} {cumulative}')
+            lines.append(f'samsung_scraper_stage_seconds_bucket{{stage="{name}",le="+Inf"}} {len(samples)}')
+            lines.append(f'samsung_scraper_stage_seconds_count{{stage="{name}"}} {len(samples)}')
+            lines.append(f'samsung_scraper_stage_seconds_sum{{stage="{name}"}} {sum(samples)}')
+        lines.append("# TYPE samsung_scraper_stage_outcomes counter")
+        for name, counter in sorted(outcomes.items()):
+            for outcome, count in sorted(counter.items()):
+                lines.append(f'samsung_scraper_stage_outcomes_total{{stage="{name}",outcome="{outcome}"}} {count}')
+        lines.append("# TYPE samsung_scraper_stage_retries counter")
+        for name, count in sorted(retries.items()):
+            lines.append(f'samsung_scraper_stage_retries_total{{stage="{name}"}} {count}')
+        lines.append("# TYPE samsung_scraper_stage_bytes counter")
+        for name, count in sorted(sizes.items()):
+            if count:
+                lines.append(f'samsung_scraper_stage_bytes_total{{stage="{name}"}} {count}')
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+    def report(self, prefix: str, openmetrics: bool = False):
+        """Write <prefix>.json and <prefix>.csv (and <prefix>.prom with `openmetrics`)."""
+        summary = self.summary()
+        with open(prefix + ".json", "w", encoding="utf-8") as f:
+            json.dump(summary, f, indent=2, default=str)
+        with open(prefix + ".csv", "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(["stage", "count", "total_s", "mean_s", "p50_s", "p95_s", "max_s", "retries", "bytes", "outcomes"])
+            for name, stats in summary["stages"].items():
+                writer.writerow([
+                    name, stats["count"], f"{stats['total_s']:.3f}", f"{stats['mean_s']:.3f}", f"{stats['p50_s']:.3f}",
+                    f"{stats['p95_s']:.3f}", f"{stats['max_s']:.3f}", stats["retries"], stats["bytes"],
+                    json.dumps(stats["outcomes"]),
+                ])
+        if openmetrics:
+            with open(prefix + ".prom", "w", encoding="utf-8") as f:
+                f.write(self.openmetrics())
+        return summary
+
+    def serve(self, port: int, host: str = "127.0.0.1"):
+        """Serve /metrics in OpenMetrics format from a background thread."""
+        metrics = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                payload = metrics.openmetrics().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "application/openmetrics-text; version=1.0.0; charset=utf-8")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.server = ThreadingHTTPServer((host, port), Handler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def stop(self):
+        if self.server:
+            self.server.shutdown()
+            self.server.server_close()
+            self.server = None
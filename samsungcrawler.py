@@ -1,199 +1,411 @@
+import argparse
 import asyncio
-import pandas as pd
-from playwright.async_api import async_playwright, expect
+import importlib.util
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from rich import print
-import re
-from fractions import Fraction
-from bs4 import BeautifulSoup
 import os
-from urllib.parse import quote_plus
+import re
+from collections import defaultdict
+from urllib.parse import quote_plus, urlparse
+from scrape_cache import ScrapeCache
+from change_tracker import ChangeTracker, page_fingerprint
+from run_journal import RunJournal
+from resource_policy import ResourcePolicy
+from product_parser import backend_name, get_parser, parse_with
+from spec_dimensions import extract_dimensions
+from browser_pool import BrowserPool
+from run_metrics import RunMetrics
+from navigation_policy import NavigationPolicy, RetryableError
+from model_index import VARIANT, ModelIndex
+
+
+PRODUCT_CARD_SELECTOR = "div.ProductCard__container___3tGUh"
+VIEW_MORE_SELECTOR = 'div[data-link_id="view more"]'
+TAB_HEADER_SELECTOR = "div.TabHeader-module__tabHeader___3VfJw"
+# The search page's explicit "nothing found" state. benchmarks/record_pages.py checks
+# the selector on every miss it records and flags pages it does not match; the text
+# pattern only covers markup changes until the selector is updated from such a page.
+NO_RESULTS_SELECTOR = "[class*='NoResult'], [class*='noResult'], [class*='no-result']"
+NO_RESULTS_RE = re.compile(r"no results|0 results|no matching|did not match any|couldn.t find", re.IGNORECASE)
+# pandas, Playwright, httpx, BeautifulSoup, lxml and openpyxl are imported where they
+# are first used, so importing this module (e.g. for extract_dimensions) stays fast.
+# rich stays a top-level import: `from rich import print` loads only the rich package
+# (under 1 ms); rich.console is imported on the first call.
+# httpx is optional: without it every product page is rendered in Chromium.
+HAS_HTTPX = importlib.util.find_spec("httpx") is not None
+# Every product card's data-mdlcode and first link, in one round-trip.
+CARDS_SCRIPT = """cards => cards.map(c => {
+    const link = c.querySelector('a');
+    return [c.getAttribute('data-mdlcode') || '', link ? link.getAttribute('href') : null];
+})"""
+# Output column telling found rows, true misses, retryable failures and other errors apart.
+STATUS_COLUMN = "Scrape Status"
+# Leading letters and digits of a model code, e.g. "QN65" for "QN65Q80CAFXZA".
+MODEL_FAMILY_RE = re.compile(r"^[A-Za-z]+\d+")
+HTTP_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.9",
+}
+
+
+def apply_entries(df, entries):
+    """Write journal entries ({index: entry}) into `df`, one bulk assignment per set of columns.
+
+    Each row only overwrites the columns its own entry has, including columns it
+    sets to None; a missing or retryable row that just sets the status keeps the
+    rest of its input.
+    """
+    import pandas as pd
+    groups = defaultdict(dict)
+    for index, entry in entries.items():
+        if entry["values"]:
+            groups[tuple(entry["values"])][index] = entry["values"]
+    if not groups:
+        return
+    columns = list(dict.fromkeys(column for keys in groups for column in keys))
+    for column in columns:
+        if column not in df.columns:
+            df[column] = None
+    df[columns] = df[columns].astype(object)
+    for keys, rows in groups.items():
+        # An object frame built from the records keeps the journal's values as they are
+        # (from_dict(orient="index") turns 3 into 3.0 and None into NaN).
+        updates = pd.DataFrame(list(rows.values()), columns=list(keys), dtype=object)
+        df.loc[list(rows), list(keys)] = updates.to_numpy()
 
 
 class SamsungScraper:
     """Web scraper for extracting product details from the Champion Manufacturing."""
-    def __init__(self, excel_path: str, output_filename: str, baseurl : str, found : int, missing : int, headless: bool = False):
+    def __init__(self, excel_path: str, output_filename: str, baseurl : str, found : int, missing : int, headless: bool = False, concurrency: int = 4,
+                 cache_path: str = None, cache_ttl: float = 7 * 24 * 3600, refresh_cache: bool = False,
+                 journal_path: str = None, resume: bool = False, resource_policy: ResourcePolicy = None,
+                 http_fast_path: bool = True, parser_backend: str = None,
+                 max_pages_per_context: int = 200, max_pages_per_browser: int = 2000, max_rss_mb: float = None,
+                 batch_search: bool = True, batch_min_group: int = 2,
+                 report_path: str = None, openmetrics: bool = False, metrics_port: int = None,
+                 streaming: bool = False, batch_size: int = 200,
+                 shard_rows=None, parse_workers: int = 0, fingerprint_path: str = None, cdp_url: str = None):
         self.filepath = excel_path
         self.output_filename = output_filename
         self.baseurl = baseurl
+        # Origin that relative product links resolve against, e.g. "https://www.samsung.com".
+        self.site_url = "{0.scheme}://{0.netloc}".format(urlparse(baseurl))
         self.headless = headless
         self.found = found
         self.missing = missing
-        self.df = pd.read_excel(self.filepath, sheet_name="Grainger")
+        self.concurrency = max(1, int(concurrency))
+        # Streaming runs read the input lazily in batches instead of loading the whole sheet.
+        self.streaming = streaming
+        self.batch_size = batch_size
+        # The sheet is read on first access to `df`. Without a workbook (service mode)
+        # only the lookup methods are usable.
+        self._df = None
         self.mfr_number = ""
+        # With refresh_cache the cache is still written, just never read.
+        self.cache = ScrapeCache(cache_path, search_ttl=cache_ttl, product_ttl=cache_ttl) if cache_path else None
+        self.refresh_cache = refresh_cache
+        # Fingerprints of previously scraped pages; unchanged pages reuse their stored record.
+        self.tracker = ChangeTracker(fingerprint_path) if fingerprint_path else None
+        self.journal_path = journal_path
+        self.resume = resume
+        self.journal = None
+        self.results = {}
+        self.resource_policy = resource_policy
+        self.http_fast_path = http_fast_path and HAS_HTTPX
+        self.http_client = None
+        self.parser_backend = backend_name(parser_backend)
+        self._parser = None
+        self.max_pages_per_context = max_pages_per_context
+        self.max_pages_per_browser = max_pages_per_browser
+        self.max_rss_mb = max_rss_mb
+        self.pool = None
+        self.page = None
+        self.batch_search = batch_search
+        self.batch_min_group = batch_min_group
+        self.batch_urls = {}
+        self.metrics = RunMetrics()
+        self.navigation = NavigationPolicy(metrics=self.metrics)
+        self.retryable = 0
+        self.errors = 0
+        self.report_path = report_path
+        self.openmetrics = openmetrics
+        self.metrics_port = metrics_port
+        # Attach to an already running Chromium (e.g. http://localhost:9222) instead of launching one.
+        if cdp_url and max_rss_mb:
+            # The RSS limit walks this process's children; an attached browser isn't one of them.
+            raise ValueError("max_rss_mb can't be enforced with cdp_url: the attached browser's memory isn't measured")
+        self.cdp_url = cdp_url
+        # Sharded runs (see sharded_run) process only these indexes and leave the
+        # workbook to the merge step.
+        self.shard_rows = None if shard_rows is None else set(shard_rows)
+        # With parse_workers, HTML is parsed in a process pool instead of on the event loop.
+        self.parse_workers = parse_workers
+        self.parse_pool = None
+
+    @property
+    def df(self):
+        """The Grainger sheet, read on first use; None in streaming or service mode."""
+        if self._df is None and not self.streaming and self.filepath is not None:
+            import pandas as pd
+            self._df = pd.read_excel(self.filepath, sheet_name="Grainger")
+        return self._df
+
+    @df.setter
+    def df(self, value):
+        self._df = value
+
+    @property
+    def parser(self):
+        """The product page parser, created (and its library imported) on first use."""
+        if self._parser is None:
+            self._parser = get_parser(self.parser_backend)
+        return self._parser
 
     async def launch_browser(self):
-        """Initialize Playwright and open the browser."""
+        """Initialize Playwright and open the browser, or attach to `cdp_url`."""
+        from playwright.async_api import async_playwright
         self.playwright = await async_playwright().start()
-        self.browser = await self.playwright.chromium.launch(headless=self.headless)
-        self.context = await self.browser.new_context()
-        self.page = await self.context.new_page()
+        if self.cdp_url:
+            launch = lambda: self.playwright.chromium.connect_over_cdp(self.cdp_url)
+        else:
+            launch = lambda: self.playwright.chromium.launch(headless=self.headless)
+        self.pool = BrowserPool(
+            launch=launch,
+            context_setup=self.resource_policy.install if self.resource_policy else None,
+            max_pages_per_context=self.max_pages_per_context,
+            max_pages_per_browser=self.max_pages_per_browser,
+            max_rss_mb=self.max_rss_mb,
+        )
+        await self.pool.start()
+        self.page = await self.pool.acquire()
+        self.open_http_client()
+
+    @property
+    def browser(self):
+        return self.pool.browser if self.pool else None
+
+    @property
+    def context(self):
+        return self.pool.context if self.pool else None
+
+    def open_http_client(self):
+        """Create the pooled HTTP client used by the product page fast path."""
+        if self.http_fast_path and self.http_client is None:
+            import httpx
+            self.http_client = httpx.AsyncClient(
+                http2=importlib.util.find_spec("h2") is not None,
+                follow_redirects=True,
+                timeout=20,
+                headers=HTTP_HEADERS,
+                limits=httpx.Limits(max_connections=self.concurrency * 2, max_keepalive_connections=self.concurrency * 2),
+            )
 
     async def close_browser(self):
         """Close the browser and Playwright instance."""
-        await self.browser.close()
+        if self.http_client:
+            await self.http_client.aclose()
+            self.http_client = None
+        await self.pool.close()
+        self.page = None
         await self.playwright.stop()
+        if self.parse_pool:
+            self.parse_pool.shutdown()
+            self.parse_pool = None
+        if self.cache:
+            self.cache.close()
+        if self.tracker:
+            self.tracker.close()
+
+    async def search_product(self, search_term: str, page=None, mfr_number: str = None):
+        """Search for a product by search term  and return its first result URL.
+
+        Timeouts, network errors and throttling are retried with backoff; if they
+        persist, RetryableError is raised instead of reporting the product missing.
+
+        `page` and `mfr_number` default to the shared `self.page` / `self.mfr_number`;
+        workers pass their own so concurrent searches don't step on each other. With
+        neither a page nor `self.page`, a page is borrowed from the browser pool.
+        """
+        page = page or self.page
+        mfr_number = self.mfr_number if mfr_number is None else mfr_number
+        if self.cache and not self.refresh_cache:
+            hit, url = self.cache.get_search(search_term, mfr_number)
+            if hit:
+                self.metrics.record("search.cache", 0.0, "hit")
+                return url
+        async def attempt():
+            if page is not None:
+                return await self.search_product_live(search_term, page, mfr_number)
+            async with self.pool.page() as pooled_page:
+                return await self.search_product_live(search_term, pooled_page, mfr_number)
+
+        try:
+            with self.metrics.stage("search.total", url=search_term) as timer:
+                url = await self.navigation.retry("search", search_term, attempt)
+                timer.outcome = "found" if url else "not_found"
+        except RetryableError:
+            # Transient failures must not become cached "Not found" rows.
+            raise
+        except Exception as e:
+            print(f"[yellow]Search for {search_term} failed - {e}[/yellow]")
+            return None
+        if self.cache:
+            self.cache.set_search(search_term, mfr_number, url)
+        return url
 
-    async def search_product(self, search_term: str):
-        """Search for a product by search term  and return its first result URL."""
+    async def search_product_live(self, search_term: str, page, mfr_number: str):
+        """Run the search on samsung.com. Errors propagate so they are never cached as misses."""
         # Properly encode the search term for use in a URL
         formatted_search_term = quote_plus(search_term)
         # print((search_term, formatted_search_term))
         url_to_navigate = self.baseurl + formatted_search_term
-        try:
-            await self.page.goto(url_to_navigate, timeout=0)
-            await expect(self.page.locator('div.TabHeader-module__tabHeader___3VfJw')).to_be_visible(timeout=5000)
-            search_results = await self.page.locator("div.ProductCard__container___3tGUh").all()
-            if search_results:
-                if len(search_results)==9:
-
-                    iter = 0
-                    while True:
-                        await self.page.wait_for_timeout(30000)
-                        view_more_button = self.page.locator('div[data-link_id="view more"]').first
-                        if await view_more_button.is_visible() and iter<=12:
-                            print("Found 'View more' button. Clicking...")
-                            iter +=1
-                            await view_more_button.click()
-                            if not await view_more_button.is_visible(timeout=10000):
-                                print("No more 'View more' button found. Exiting loop.")
-                                break
-                        else:
-                            print("'View more' button not visible. Exiting loop.")
-                            break
-                search_results = await self.page.locator("div.ProductCard__container___3tGUh").all()
-                print(f"Found {len(search_results)} products")
-
-            
-                for product in search_results:
-                    
-                    mdl_code = await product.get_attribute("data-mdlcode")
-                    if len(search_results)==1:
-                        first_a_tag = product.locator("a").first
-                        url = "https://www.samsung.com" + await first_a_tag.get_attribute("href")
-
-                        # print(f"Model Code: {mdl_code}, Link: {url}")
-                        return url
-                    elif mdl_code.lower() in self.mfr_number.lower():
-                        first_a_tag = product.locator("a").first
-                        url = "https://www.samsung.com" + await first_a_tag.get_attribute("href")
-
-                        # print(f"Model Code: {mdl_code}, Link: {url}")
-                        return url
-                    else:
-                        pass
-                return None
-                
-        except Exception as e:
-            # print(f"Error occurred: {e}")
-            pass
+        with self.metrics.stage("search.goto", url=url_to_navigate):
+            await self.navigation.goto(page, url_to_navigate, "search")
+        if not await self.wait_for_results(page):
+            return None
+        cards = await self.listing_cards(page)
+        if cards:
+            if len(cards)==9:
+                with self.metrics.stage("search.view_more", url=url_to_navigate):
+                    await self.load_more_results(page, mfr_number)
+                cards = await self.listing_cards(page)
+            print(f"Found {len(cards)} products")
+            if len(cards)==1:
+                href = cards[0][1]
+                return self.site_url + href if href else None
+            href = ModelIndex(cards).best(mfr_number)
+            return self.site_url + href if href else None
         return None
 
-    def extract_dimensions(self, data):
-        dimensions = {"width": None, "height": None, "depth": None, "weight": None, "shipping_weight": None}
-
-        def extract_number(value):
-            """Extracts the first numeric value from a string."""
-            match = re.findall(r"[\d.]+", value)
-            return match[0] if match else None
-
-        def extract_dimensions_from_string(value):
-            """Extracts width, height, and depth from a formatted dimension string (e.g., '22.9" D x 32.0" H x 23.7" W')."""
-            match = re.findall(r"([\d.]+)[\"']?\s*[D|d]?\s*[xX]\s*([\d.]+)[\"']?\s*[H|h]?\s*[xX]\s*([\d.]+)[\"']?\s*[W|w]?", value)
-            if match:
-                return match[0]  
-            else:
-                match = extract_dimensions_from_string_fraction(value)
-                return match
-            return None
-        
-        def extract_dimensions_from_string_fraction(value):
-            """Extracts width, height, and depth from a formatted dimension string (e.g., '30" W x 5 1/10" H x 21 1/4" D')."""
-            
-            def convert_to_decimal(fraction_str):
-                """Converts a fraction string (e.g., '1/10') to a decimal number."""
+    @staticmethod
+    async def wait_for_results(page, timeout: int = 5000):
+        """True once the result tabs render, False when the page says there are no results.
+
+        If neither shows up in time, Playwright's TimeoutError propagates: a slow or
+        broken page is retried by the navigation policy instead of being cached as a miss.
+        """
+        tabs = page.locator(TAB_HEADER_SELECTOR)
+        no_results = page.locator(NO_RESULTS_SELECTOR).or_(page.get_by_text(NO_RESULTS_RE))
+        await tabs.or_(no_results).first.wait_for(state="visible", timeout=timeout)
+        return await tabs.first.is_visible()
+
+    @staticmethod
+    async def listing_cards(page):
+        """[data-mdlcode, href] for every loaded product card."""
+        return await page.eval_on_selector_all(PRODUCT_CARD_SELECTOR, CARDS_SCRIPT)
+
+    @staticmethod
+    def model_family(mfr_number: str):
+        """Model family prefix shared by related mfr numbers, or None."""
+        match = MODEL_FAMILY_RE.match(str(mfr_number).strip())
+        return match.group(0).upper() if match else None
+
+    async def collect_listing(self, search_term: str, page):
+        """Load every result for a search term and index them by model code (values are product URLs)."""
+        await self.navigation.goto(page, self.baseurl + quote_plus(search_term), "search")
+        if not await self.wait_for_results(page):
+            return ModelIndex()
+        await self.load_more_results(page, "")
+        cards = await self.listing_cards(page)
+        return ModelIndex((mdl_code, self.site_url + href) for mdl_code, href in cards if href)
+
+    @staticmethod
+    def match_listing(listing: ModelIndex, mfr_number: str):
+        """URL of the card that is the mfr number itself or a regional variant of it, or None.
+
+        A family listing is full of related models, so a prefix match there is a
+        guess; those rows are left to the per-row search.
+        """
+        found = listing.match(mfr_number)
+        return found[2] if found and found[0] <= VARIANT else None
+
+    async def resolve_batch(self, mfr_numbers):
+        """Resolve many mfr numbers with one search per model family.
+
+        Families with at least `batch_min_group` pending rows are searched once,
+        the full listing is indexed by data-mdlcode, and every row the index can
+        answer is stored in `self.batch_urls` (and the search cache). Rows it
+        can't answer are left to the normal per-row search.
+        """
+        groups = defaultdict(set)
+        for mfr_number in mfr_numbers:
+            if self.cache and not self.refresh_cache and self.cache.get_search(mfr_number, mfr_number)[0]:
+                continue
+            family = self.model_family(mfr_number)
+            if family:
+                groups[family].add(mfr_number)
+        groups = {family: members for family, members in groups.items() if len(members) >= self.batch_min_group}
+        if not groups:
+            return
+        print(f"[cyan]Batch search: {sum(map(len, groups.values()))} rows across {len(groups)} model families[/cyan]")
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def resolve_family(family, members):
+            async with semaphore:
                 try:
-                    return float(Fraction(fraction_str))
-                except ValueError:
-                    return None
-            
-            # Pattern to match dimensions like '30" W x 5 1/10" H x 21 1/4" D'
-            match = re.findall(r"([\d\s/]+)[\"']?\s*[W|w]?\s*[xX]\s*([\d\s/]+)[\"']?\s*[H|h]?\s*[xX]\s*([\d\s/]+)[\"']?\s*[D|d]?", value)
-            
-            if match:
-                width = match[0][0]
-                height = match[0][1]
-                depth = match[0][2]
-
-                # Convert fraction dimensions to decimal
-                width_decimal = convert_to_decimal(width.replace(" ", "").replace('"', ''))
-                height_decimal = convert_to_decimal(height.replace(" ", "").replace('"', ''))
-                depth_decimal = convert_to_decimal(depth.replace(" ", "").replace('"', ''))
-
-                return (width_decimal, height_decimal, depth_decimal)
-            
-            return None
-        
-        dimension_keys = [
-            "Set Dimension without Stand (WxHxD)",
-            "Set Without Stand",
-            "Product Size (W x H x D) Without Stand?Width, height and depth of the television, without stand, as measured in inches (in.).",
-            "Dimensions (WxHxD)",
-            "Set Dimension (WxHxD)",
-            "Box Dimension (inches, WxHxD)",
-            "Product Size (W x H x D) Without Stand",
-            "Dimension (WxHxD)",
-            "Product Dimensions without Hinges or Handles",
-            "Product Dimensions",
-            "Product Dimensions Without Stand",
-            "Main Unit Size (Inch)"
-        ]
-        weight_keys = [
-            "Weight",
-            "Set Weight without Stand",
-            "Set Without Stand",
-            "Product Weight Without Stand?Weight of the television, without stand, as measured in pounds (lb.).",
-            "Weight (lbs)",
-            "Product Weight",
-            "Package Weight",
-            "Product Weight Without Stand",
-            "Product Weight (lbs.)"
-        ]
-        shipping_weight_keys = [
-            "Shipping Weight?Weight of the television, with shipping container, as measured in pounds (lbs.).",
-            "Shipping Weight (lbs.)",
-            "Shipping Weight"
-        ]
-        voltz = ""
-        hertz = ""
-        amps = ""
-        watts = ""
-
-        for section, attributes in data.items():
-            if isinstance(attributes, dict):
-                for key, value in attributes.items():
-                    if isinstance(value, str):
-                        if any(dim_key.lower() == key.lower() for dim_key in dimension_keys):
-                            dim_match = extract_dimensions_from_string(value)
-                            if dim_match:
-                                dimensions["width"], dimensions["height"], dimensions["depth"] = dim_match
-                        if any(weight_key.lower() == key.lower() for weight_key in weight_keys):
-                                dimensions["weight"] = extract_number(value)
-                        if any(shipping_key.lower() == key.lower() for shipping_key in shipping_weight_keys):
-                            dimensions["shipping_weight"] = extract_number(value)
-
-                    if "Voltz/Hertz/Amps" in key:
-                        voltz, hertz, amps = map(str.strip, value.split("/"))
-                    elif "Watts" in key:
-                        watts = value.strip()
-                    elif "Voltz" in key and all(x not in key for x in ["Hertz", "Amps"]):
-                        voltz = value.strip()
-                    elif "Hertz" in key and all(x not in key for x in ["Voltz", "Amps"]):
-                        hertz = value.strip()
-                    elif "Amps" in key and all(x not in key for x in ["Voltz", "Hertz"]):
-                        amps = value.strip()
-
-        return dimensions, [voltz, hertz, amps, watts]
-    
+                    async with self.pool.page() as page:
+                        listing = await self.collect_listing(family, page)
+                except Exception as e:
+                    print(f"[yellow]Batch search for {family} failed - {e}[/yellow]")
+                    return
+            for mfr_number in members:
+                url = self.match_listing(listing, mfr_number)
+                if url:
+                    self.batch_urls[mfr_number] = url
+                    if self.cache:
+                        self.cache.set_search(mfr_number, mfr_number, url)
+
+        await asyncio.gather(*(resolve_family(family, members) for family, members in groups.items()))
+        print(f"[cyan]Batch search resolved {len(self.batch_urls)} rows[/cyan]")
+
+    async def has_matching_card(self, page, mfr_number: str):
+        """Return True if a loaded card is the mfr number itself or a regional variant of it.
+
+        Prefix matches don't count: a closer card may still be behind "View more".
+        """
+        if not mfr_number:
+            return False
+        found = ModelIndex(await self.listing_cards(page)).match(mfr_number)
+        return found is not None and found[0] <= VARIANT
+
+    async def load_more_results(self, page, mfr_number: str, max_clicks: int = 13, timeout: int = 15000):
+        """Click "View more" until the list stops growing, the button goes away or a matching card shows up.
+
+        Each pass waits for a real signal (card count growing or the button detaching)
+        followed by network idle, instead of sleeping for a fixed interval.
+        """
+        for _ in range(max_clicks):
+            if await self.has_matching_card(page, mfr_number):
+                print("Matching product already loaded. Skipping 'View more'.")
+                break
+            view_more_button = page.locator(VIEW_MORE_SELECTOR).first
+            if not await view_more_button.is_visible():
+                print("'View more' button not visible. Exiting loop.")
+                break
+            card_count = await page.locator(PRODUCT_CARD_SELECTOR).count()
+            print("Found 'View more' button. Clicking...")
+            await view_more_button.click()
+            try:
+                await page.wait_for_function(
+                    """([cardSelector, buttonSelector, previous]) =>
+                        document.querySelectorAll(cardSelector).length > previous
+                        || !document.querySelector(buttonSelector)""",
+                    arg=[PRODUCT_CARD_SELECTOR, VIEW_MORE_SELECTOR, card_count],
+                    timeout=timeout,
+                )
+            except Exception:
+                print("No new products after clicking 'View more'. Exiting loop.")
+                break
+            try:
+                await page.wait_for_load_state("networkidle", timeout=5000)
+            except Exception:
+                pass
+
+    def extract_dimensions(self, data):
+        """Extract dimensions, weights and electrical ratings from a specification dict."""
+        return extract_dimensions(data)
 
     def check_certification(self, data):
         # Convert all the values in the dictionary to lowercase
@@ -222,24 +434,140 @@ class SamsungScraper:
         else:
             return "N"
       
-    async def scrape_product_details(self, url: str):
-        """Extract product details from the given URL."""
+    async def scrape_product_details(self, url: str, page=None):
+        """Extract product details from the given URL, serving from the cache when possible.
+
+        With change detection on, the product cache is not read: every page is
+        fetched and checked against its fingerprint, so changes show up on the
+        next run rather than once the cache entry expires.
+        """
+        if self.cache and not self.refresh_cache and not self.tracker:
+            data = self.cache.get_product(url)
+            if data is not None:
+                print(f"[cyan]Cached data for:[/cyan] {url}")
+                self.metrics.record("product.cache", 0.0, "hit")
+                return data
+        with self.metrics.stage("product.total", url=url):
+            data = await self.scrape_product_details_live(url, page=page)
+        # A page without specifications is a failed or partial render: scrape it again next run.
+        if self.cache and data and data.get("specifications"):
+            self.cache.set_product(url, data)
+        return data
+
+    async def scrape_product_details_live(self, url: str, page=None):
+        """Extract product details, trying a plain HTTP GET before falling back to the browser."""
+        if self.http_client:
+            response = await self.fetch_product_html(url)
+            if response is not None and response.status_code == 304:
+                data = self.tracker.not_modified(url)
+                if data is not None:
+                    print(f"[cyan]Not modified since last run:[/cyan] {url}")
+                    return data
+            elif response is not None:
+                data = await self.parse_changed_html(
+                    url, response.text, response.headers.get("ETag"), response.headers.get("Last-Modified")
+                )
+                if data["specifications"]:
+                    print(f"[cyan]Scraped over HTTP:[/cyan] {url}")
+                    return data
+        return await self.scrape_product_details_browser(url, page=page)
+
+    async def fetch_product_html(self, url: str):
+        """GET a product page with the pooled HTTP client.
+
+        Returns the response for a 200, or a 304 to a conditional request built from
+        the change tracker's validators; None if the page can't be fetched.
+        """
+        headers = self.tracker.conditional_headers(url) if self.tracker and not self.refresh_cache else None
+        with self.metrics.stage("product.http_fetch", url=url) as timer:
+            try:
+                response = await self.navigation.get(self.http_client, url, "product.http", headers=headers)
+            except Exception as e:
+                print(f"[yellow]HTTP fetch failed for {url} - {e}[/yellow]")
+                timer.outcome = "error"
+                return None
+            timer.bytes = len(response.content)
+            if response.status_code == 304 and headers:
+                timer.outcome = "not_modified"
+                return response
+            if response.status_code != 200:
+                timer.outcome = f"http_{response.status_code}"
+                return None
+            return response
+
+    async def parse_changed_html(self, url: str, html_content: str, etag: str = None, last_modified: str = None):
+        """Parse a product page unless its fingerprint matches the previous run's,
+        in which case the record stored for it is returned without parsing."""
+        if self.tracker is None:
+            return await self.parse_product_html_async(url, html_content)
+        fingerprint = page_fingerprint(html_content)
+        if not self.refresh_cache:
+            data = self.tracker.reuse(url, fingerprint, etag, last_modified)
+            if data is not None:
+                self.metrics.record("product.parse", 0.0, "unchanged", url=url)
+                print(f"[cyan]Unchanged since last run:[/cyan] {url}")
+                return data
+        data = await self.parse_product_html_async(url, html_content)
+        if data["specifications"]:
+            self.tracker.update(url, fingerprint, data, etag, last_modified)
+        return data
+
+    async def scrape_product_details_browser(self, url: str, page=None):
+        """Extract product details from the given URL with Playwright.
+
+        When `page` is given it is used (and left open); otherwise a page is borrowed
+        from the browser pool and returned to it, even if scraping fails.
+        """
         print(f"[cyan]Scraping data from:[/cyan] {url}")
-        new_page = await self.context.new_page()
-        await new_page.goto(url, timeout = 0)
+
+        async def attempt():
+            if page is not None:
+                return await self.render_product_page(url, page)
+            async with self.pool.page() as pooled_page:
+                return await self.render_product_page(url, pooled_page)
+
+        return await self.navigation.retry("product", url, attempt)
+
+    async def render_product_page(self, url: str, new_page):
+        """Load a product page, expand the full spec list and parse the result."""
+        with self.metrics.stage("product.goto", url=url):
+            await self.navigation.goto(new_page, url, "product")
+        from playwright.async_api import expect
         expand_btn = new_page.locator('//a[(normalize-space(text())="See All Specs") or (@aria-label="See All Specs")]').first
         if await expand_btn.count() > 0:
-            try:
-                await expand_btn.wait_for(state="visible", timeout=15000)
-                await expect(expand_btn).to_be_visible(timeout=15000)
-                await expand_btn.click(force=True)
-                await new_page.wait_for_timeout(1000)
-            except Exception as e:
-                print(f"[yellow]Warning: Expand button not interactable - {e}[/yellow]")
+            with self.metrics.stage("product.expand", url=url) as timer:
+                try:
+                    await expand_btn.wait_for(state="visible", timeout=15000)
+                    await expect(expand_btn).to_be_visible(timeout=15000)
+                    await expand_btn.click(force=True)
+                    await new_page.wait_for_timeout(1000)
+                except Exception as e:
+                    timer.outcome = "not_interactable"
+                    print(f"[yellow]Warning: Expand button not interactable - {e}[/yellow]")
 
         else:
             print("[yellow]Expand button not found, skipping...[/yellow]")
-                
+
+        html_content = await new_page.content()
+        return await self.parse_changed_html(url, html_content)
+
+    async def parse_product_html_async(self, url: str, html_content: str):
+        """parse_product_html, with the HTML parsing done in the process pool when
+        `parse_workers` is set so it doesn't block the event loop."""
+        if not self.parse_workers:
+            return self.parse_product_html(url, html_content)
+        if self.parse_pool is None:
+            self.parse_pool = ProcessPoolExecutor(self.parse_workers, mp_context=multiprocessing.get_context("spawn"))
+        with self.metrics.stage("product.parse", url=url) as timer:
+            timer.bytes = len(html_content)
+            fields = await asyncio.get_running_loop().run_in_executor(self.parse_pool, parse_with, self.parser_backend, html_content)
+        return self.parse_product_html(url, html_content, fields=fields)
+
+    def parse_product_html(self, url: str, html_content: str, fields: dict = None):
+        """Parse a rendered or server-side product page into the product data dict.
+
+        `fields` are parser results computed elsewhere; only the derived columns are added then.
+        """
         data = {
             "url": url,
             "image": "",
@@ -256,106 +584,12 @@ class SamsungScraper:
             "shipping_weight" : "",
         }
 
-        specifications = {}
-
-        #Extract Specificatiobns
-        try:
-            html_content = await new_page.content()
-            soup = BeautifulSoup(html_content, 'html.parser')
-            spec_groups_ul = soup.find("ul", class_ = "row spec-details__list")
-            if spec_groups_ul:
-                spec_li = spec_groups_ul.find_all("li", itemscope=True)
-            
-                for section in spec_li:
-                    category_name_elem = section.find('span', itemprop='name')
-
-                    # Check if the category name exists
-                    if category_name_elem:
-                        category = category_name_elem.text.strip()
-                        specifications[category] = {}
-
-                        # Find all spec items within the section
-                        spec_items = section.find_all('div', class_='sub-specs__item')
-                        
-                        for item in spec_items:
-                            # Extract key and value from each spec item
-                            key_elem = item.find('span', class_='specs-item-name')
-                            value_elem = item.find('p', class_='sub-specs__item__value')
-                            
-                            if key_elem and value_elem:
-                                key = key_elem.text.strip()
-                                value = value_elem.text.strip()
-                                specifications[category][key] = value
-                            else:
-                                print(f"Missing key/value in item: {item}")
-                    else:
-                        print("Category name missing for section:", section)
-            else:
-                spec_groups_ul = soup.find("ul", class_ = "Specs_specRow__e9Ife Specs_specDetailList__StjuR")
-                if spec_groups_ul:
-                    spec_li = spec_groups_ul.find_all("li")
-
-                    for section in spec_li:
-                        category_name_elem = section.find('figcaption')
-                        
-                        # Check if the category name exists
-                        if category_name_elem:
-                            category = category_name_elem.text.strip()
-                            specifications[category] = {}
-
-                            # Find all spec items within the section
-                            spec_items = section.find_all('div', class_='subSpecsItem')
-
-                            for item in spec_items:
-                                # Extract key and value from each spec item
-                                key_elem = item.find('div', class_='Specs_subSpecItemName__IUPV4')
-                                value_elem = item.find('div', class_='Specs_subSpecsItemValue__oWnMq')
-
-                                if key_elem and value_elem:
-                                    key = key_elem.text.strip()
-                                    value = value_elem.text.strip()
-                                    specifications[category][key] = value
-                                else:
-                                    print(f"Missing key/value in item: {item}")
-                        else:
-                            print("Category name missing for section:", section)
-                else:
-                    print("Specification groups not found.")
-
-            data["specifications"] = specifications
-            # print(specifications)
-        except Exception as e:
-            print(f"Error extracting image: {e}")
-            
-        # Extract Product Image (jpg)
-        try:
-            
-            image_locators =soup.find_all("img")
-            if image_locators:
-                for item in image_locators:
-                    src = item.get("src")
-                    if src and src.startswith("https://image-us.samsung.com") and ".png" not in src:
-                        data["image"] = src.replace("$", "")
-                        # print(src.replace("$", ""))
-                        break
-            else:
-                print("Product Image Not  found ")
-        except Exception as e:
-            print(f"Error extracting image: {e}")
-
-        # Extract Product Description
-        try:
-        
-            description_locator = soup.find("ul", class_ = "product-details__info-description")
-            if description_locator:
-                data["description"] = description_locator.get_text().replace("\n", "").replace("\t", "")
-            else:
-                description_locator = soup.find("div", class_ = "ProductSummary_detailList__zDn4_" )
-                if description_locator:
-                    data["description"] = description_locator.get_text().replace("\n", "").replace("\t", "")
-            # print(data["description"])
-        except Exception as e:
-            print(f"Error extracting description: {e}")
+        if fields is None:
+            with self.metrics.stage("product.parse", url=url) as timer:
+                timer.bytes = len(html_content)
+                fields = self.parser.parse(html_content)
+        data.update(fields)
+        specifications = data["specifications"]
 
         # Extract Measurements and Dimensions
         try:
@@ -367,39 +601,6 @@ class SamsungScraper:
         except Exception as e:
             print(f"Error extracting dimensions: {e}")
 
-        # Extract Price
-        try:
-            price_div = soup.find("div", class_="PriceInfoText_priceInfo__QEjy8")
-            if price_div:
-                price_tag = price_div.find("b")  # Find the bold price text
-                if price_tag:
-                    price = price_tag.text.strip()
-                    data["price"] = price
-                    # print(price)
-                else:
-                    print("Price not found inside <b> tag.")
-            else:
-                price_span = soup.find("span", class_ = "product-top-nav__font-price")
-                if price_span:
-                    price = price_span.get_text(strip=True)
-                    data["price"] = price
-                    # print(price)
-                else:
-                    print("Price div not found.")
-        except Exception as e:
-            print(f"Error extracting price: {e}")
-
-        #Extract Specification pdf download link
-        try:
-            spec_pdf_div = soup.find('div', class_ = "span-sm-2 span-lg-2 spec-download")
-            if spec_pdf_div:
-                spec_pdf = spec_pdf_div.find("a").get("href")
-                data["spec_pdf"] = spec_pdf
-                # print(spec_pdf)
-
-        except Exception as e:
-            print(f"Error extracting spec_pdf: {e}")
-
         #Extract green certification
         try:
             if specifications:
@@ -408,74 +609,325 @@ class SamsungScraper:
                 
         except Exception as e:
             print(f"Error extracting certification: {e}")
-        await new_page.close()
         return data
 
 
-    async def run(self):
-        """Main function to scrape product details and save them to an Excel file."""
-        await self.launch_browser()
-        await self.page.goto(self.baseurl, timeout = 0)
-    
-        for index, row in self.df.iterrows():
-            mfr_number = row["mfr number"]
-            self.mfr_number = str(mfr_number)
-            model_name = row['model name']
-            url = await self.search_product(str(mfr_number))
-            if not url:
-                url = await self.search_product(str(model_name))
-            if not url or url == "https://www.samsung.com":
-                self.missing += 1
-            else:
-                self.found += 1
-            if url and url!="https://www.samsung.com":
-                product_data = await self.scrape_product_details(url)
-                if product_data:
-                    print(f"[green]{model_name} | {mfr_number} [/green] - Data extracted successfully.")
-                    self.df.at[index, "Product URL"] = product_data.get("url", "")
-                    self.df.at[index, "Product Image (jpg)"] = product_data.get("image", "")
-                    self.df.at[index, "Product Image"] = product_data.get("image", "")
-                    self.df.at[index, "product description"] = product_data.get("description", "")
-                    self.df.at[index, "Specification Sheet (pdf)"] = product_data.get("spec_pdf", "")
-                    self.df.at[index, "unit cost"] = product_data.get("price", "")
-                    if product_data["dimensions"]!="":
-                        self.df.at[index, "depth"] = product_data["dimensions"].get("depth", "")
-                        self.df.at[index, "height"] = product_data["dimensions"].get("height", "")
-                        self.df.at[index, "width"] = product_data["dimensions"].get("width", "")
-                        self.df.at[index, "weight"] = product_data["dimensions"].get("weight", "")
-                        self.df.at[index, "ship_weight"] = product_data["dimensions"].get("shipping_weight", "")
-                    self.df.at[index, "green certification? (Y/N)"] = product_data.get("green_certification", "")
-                    self.df.at[index, "volts"] = product_data.get("volts", "")
-                    self.df.at[index, "hertz"] = product_data.get("hertz", "")
-                    self.df.at[index, "amps"] = product_data.get("amps", "")
-                    self.df.at[index, "watts"] = product_data.get("watts", "")
-                    self.df.at[index, "emergency_power Required (Y/N)"] = "N"
-                    self.df.at[index, "dedicated_circuit Required (Y/N)"] = "N"
-                    self.df.at[index, "water_cold Required (Y/N)"] = "N"
-                    self.df.at[index, "water_hot  Required (Y/N)"] = "N"
-                    self.df.at[index, "drain Required (Y/N)"] = "N"
-                    self.df.at[index, "water_treated (Y/N)"] = "N"
-                    self.df.at[index, "steam  Required(Y/N)"] = "N"
-                    self.df.at[index, "vent  Required (Y/N)"] = "N"
-                    self.df.at[index, "vacuum Required (Y/N)"] = "N"
-                    self.df.at[index, "ada compliant (Y/N)"] = "N"
-                    self.df.at[index, "antimicrobial coating (Y/N)"] = "N"
-            else:
-                print(f"[red]{model_name} | {mfr_number} [/red] - Not found")
+    def product_columns(self, product_data):
+        """Map a scraped product record to the output workbook columns."""
+        values = {
+            "Product URL": product_data.get("url", ""),
+            "Product Image (jpg)": product_data.get("image", ""),
+            "Product Image": product_data.get("image", ""),
+            "product description": product_data.get("description", ""),
+            "Specification Sheet (pdf)": product_data.get("spec_pdf", ""),
+            "unit cost": product_data.get("price", ""),
+        }
+        if product_data["dimensions"]!="":
+            values["depth"] = product_data["dimensions"].get("depth", "")
+            values["height"] = product_data["dimensions"].get("height", "")
+            values["width"] = product_data["dimensions"].get("width", "")
+            values["weight"] = product_data["dimensions"].get("weight", "")
+            values["ship_weight"] = product_data["dimensions"].get("shipping_weight", "")
+        values["green certification? (Y/N)"] = product_data.get("green_certification", "")
+        values["volts"] = product_data.get("volts", "")
+        values["hertz"] = product_data.get("hertz", "")
+        values["amps"] = product_data.get("amps", "")
+        values["watts"] = product_data.get("watts", "")
+        for column in [
+            "emergency_power Required (Y/N)",
+            "dedicated_circuit Required (Y/N)",
+            "water_cold Required (Y/N)",
+            "water_hot  Required (Y/N)",
+            "drain Required (Y/N)",
+            "water_treated (Y/N)",
+            "steam  Required(Y/N)",
+            "vent  Required (Y/N)",
+            "vacuum Required (Y/N)",
+            "ada compliant (Y/N)",
+            "antimicrobial coating (Y/N)",
+        ]:
+            values[column] = "N"
+        return values
+
+    def record_row(self, index, status: str, values: dict):
+        """Remember a finished row, journaling it to disk when a journal is configured."""
+        if self.journal:
+            self.journal.append(index, status, values)
+        else:
+            self.results[index] = {"index": index, "status": status, "values": values}
+
+    def apply_results(self, entries):
+        """Write every finished row into the DataFrame in one bulk assignment."""
+        apply_entries(self.df, entries)
+
+    async def process_row(self, index, row):
+        """Search, scrape and store a single input row; pages come from the browser pool."""
+        with self.metrics.stage("row.total", url=str(row["mfr number"])) as timer:
+            timer.outcome = await self.process_row_stages(index, row)
+
+    async def lookup_product(self, mfr_number: str, model_name: str):
+        """Resolve one product by mfr number, then model name; returns (url, product_data).
+
+        url is None for a miss. A RetryableError from the mfr number search still
+        lets the model name search run; it is raised if that finds nothing either.
+        """
+        product_data = None
+        search_error = None
+        url = self.batch_urls.get(str(mfr_number))
+        if not url:
+            try:
+                url = await self.search_product(str(mfr_number), mfr_number=str(mfr_number))
+            except RetryableError as e:
+                search_error = e
+        if not url:
+            url = await self.search_product(str(model_name), mfr_number=str(mfr_number))
+        if not url and search_error:
+            raise search_error
+        if url == self.site_url:
+            url = None
+        if url:
+            product_data = await self.scrape_product_details(url)
+            if self.tracker:
+                self.tracker.note_sku(url, str(mfr_number))
+        return url, product_data
+
+    async def process_row_stages(self, index, row):
+        mfr_number = row["mfr number"]
+        model_name = row['model name']
+        try:
+            url, product_data = await self.lookup_product(mfr_number, model_name)
+        except RetryableError as e:
+            # Not a real miss: left out of the found/missing totals and retried on --resume.
+            self.retryable += 1
+            print(f"[yellow]{model_name} | {mfr_number} [/yellow] - Retryable error ({e.category})")
+            self.record_row(index, "retryable", {STATUS_COLUMN: f"Retryable error ({e.category})"})
+            return "retryable"
+        if url:
+            self.found += 1
+            values = {}
+            if product_data:
+                print(f"[green]{model_name} | {mfr_number} [/green] - Data extracted successfully.")
+                values = self.product_columns(product_data)
+            values[STATUS_COLUMN] = "Found"
+            self.record_row(index, "found", values)
+            return "found"
+        self.missing += 1
+        print(f"[red]{model_name} | {mfr_number} [/red] - Not found")
+        self.record_row(index, "missing", {STATUS_COLUMN: "Not found"})
+        return "missing"
+
+    async def worker(self, queue: asyncio.Queue):
+        """Drain rows from the queue until it is empty."""
+        while True:
+            try:
+                index, row = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            try:
+                await self.process_row(index, row)
+            except Exception as e:
+                # Non-retryable failure: still journaled so the totals cover every row; --resume retries it.
+                self.errors += 1
+                print(f"[red]Error processing row {index}: {e}[/red]")
+                self.record_row(index, "error", {STATUS_COLUMN: f"Error ({type(e).__name__})"})
+            finally:
+                queue.task_done()
+
+    async def start_run(self):
+        """Launch the browser, open the journal and return the rows it already holds."""
+        if self.metrics_port:
+            self.metrics.serve(self.metrics_port)
+        with self.metrics.stage("run.launch_browser"):
+            await self.launch_browser()
+            await self.navigation.goto(self.page, self.baseurl, "search")
+        # Workers borrow pages from the pool; hand the warm-up page back to it.
+        await self.pool.release(self.page)
+        self.page = None
+
+        self.results = {}
+        self.journal = RunJournal(self.journal_path, resume=self.resume) if self.journal_path else None
+        # Rows that ended in a retryable error or another error are not done; they are picked up again.
+        entries = self.journal.entries if self.journal else {}
+        done = {index: entry for index, entry in entries.items() if entry["status"] in ("found", "missing")}
+        if done:
+            self.found += sum(1 for entry in done.values() if entry["status"] == "found")
+            self.missing += sum(1 for entry in done.values() if entry["status"] == "missing")
+            print(f"[cyan]Resuming: {len(done)} rows already in {self.journal_path}[/cyan]")
+        return done
+
+    async def process_rows(self, pending):
+        """Run the batch search and the worker pool over a list of (index, row) pairs."""
+        if not pending:
+            return
+        if self.batch_search:
+            with self.metrics.stage("run.batch_search"):
+                await self.resolve_batch({str(row["mfr number"]) for _, row in pending})
+
+        queue = asyncio.Queue()
+        for item in pending:
+            queue.put_nowait(item)
+
+        workers = min(self.concurrency, queue.qsize()) or 1
+        print(f"[cyan]Processing {queue.qsize()} rows with {workers} workers[/cyan]")
+        with self.metrics.stage("run.rows"):
+            await asyncio.gather(*(self.worker(queue) for _ in range(workers)))
+
+    def print_totals(self):
         print(f"[red]Missing : {self.missing} [/red]")
         print(f"[green]Found : {self.found} [/green]")
-        self.df.to_excel(self.output_filename, index=False, sheet_name="Grainger")
+        if self.retryable:
+            print(f"[yellow]Retryable errors : {self.retryable} (rerun with --resume) [/yellow]")
+        if self.errors:
+            print(f"[red]Errors : {self.errors} (rerun with --resume) [/red]")
+        if self.resource_policy:
+            self.resource_policy.print_report()
+        print(f"[cyan]Browser pool: {self.pool.stats()}[/cyan]")
+        if self.tracker:
+            print(f"[cyan]Product pages: {len(self.tracker.changes)} changed, {self.tracker.unchanged} unchanged, {self.tracker.new} new[/cyan]")
+
+    async def run(self):
+        """Main function to scrape product details and save them to an Excel file."""
+        if self.streaming:
+            return await self.run_streaming()
+        done = await self.start_run()
+        pending = [
+            (index, row) for index, row in self.df.iterrows()
+            if index not in done and (self.shard_rows is None or index in self.shard_rows)
+        ]
+        try:
+            await self.process_rows(pending)
+        finally:
+            if self.journal:
+                self.journal.close()
+
+        self.print_totals()
+        if self.shard_rows is None:
+            with self.metrics.stage("run.excel_write"):
+                self.apply_results(self.journal.entries if self.journal else self.results)
+                self.df.to_excel(self.output_filename, index=False, sheet_name="Grainger")
+        await self.close_browser()
+        self.write_report()
+
+    async def run_streaming(self):
+        """Process the input in bounded batches, writing enriched rows as each batch finishes.
+
+        Input rows are read lazily and written through a write-only sink, so memory
+        does not grow with the size of the sheet. Rows already in the journal are
+        written from it without being scraped again.
+        """
+        from row_stream import RowWriter, iter_rows, read_header
+        done = await self.start_run()
+        header = read_header(self.filepath)
+        extra_columns = [c for c in [*self.product_columns({"dimensions": {}}), STATUS_COLUMN] if c not in header]
+        writer = RowWriter(self.output_filename, header + extra_columns)
+        try:
+            for _, batch in iter_rows(self.filepath, batch_size=self.batch_size):
+                await self.process_rows([(index, row) for index, row in batch if index not in done])
+                with self.metrics.stage("run.batch_write"):
+                    finished = self.journal.entries if self.journal else self.results
+                    rows = []
+                    for index, row in batch:
+                        entry = finished.get(index) if self.journal else finished.pop(index, None)
+                        rows.append({**row, **entry["values"]} if entry else row)
+                        if entry and self.journal:
+                            # Written rows only need their status for resuming; drop the values.
+                            entry["values"] = {}
+                    writer.write(rows)
+                # Batch search URLs are only looked up by this batch's rows.
+                self.batch_urls.clear()
+        finally:
+            writer.close()
+            if self.journal:
+                self.journal.close()
+
+        self.print_totals()
         await self.close_browser()
+        self.write_report()
+
+    def write_report(self):
+        """Write the run report (JSON/CSV, plus OpenMetrics if enabled) next to the output."""
+        self.metrics.extra["totals"] = {"found": self.found, "missing": self.missing, "retryable": self.retryable, "errors": self.errors}
+        self.metrics.extra["navigation"] = self.navigation.stats()
+        self.metrics.extra["browser_pool"] = self.pool.stats() if self.pool else {}
+        if self.resource_policy:
+            self.metrics.extra["resource_policy"] = self.resource_policy.report()
+        if self.tracker:
+            self.metrics.extra["changes"] = self.tracker.report()
+        if self.report_path:
+            self.metrics.report(self.report_path, openmetrics=self.openmetrics)
+            print(f"[cyan]Run report written to {self.report_path}.json[/cyan]")
+        self.metrics.stop()
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Scrape Samsung product details into the Grainger workbook.")
+    parser.add_argument("--concurrency", type=int, default=4, help="Number of concurrent workers.")
+    parser.add_argument("--refresh-cache", action="store_true", help="Ignore cached searches/products and re-scrape them.")
+    parser.add_argument("--browser-only", action="store_true", help="Always render product pages in Chromium, skipping the HTTP fast path.")
+    parser.add_argument("--parser", choices=["bs4", "lxml"], default=None, help="HTML parser backend (default: lxml when installed).")
+    parser.add_argument("--max-rss-mb", type=float, default=None, help="Relaunch Chromium once the browser's memory passes this many MB.")
+    parser.add_argument("--no-batch-search", action="store_true", help="Search every row individually instead of once per model family.")
+    parser.add_argument("--no-block", action="store_true", help="Load images, fonts, media and trackers instead of blocking them.")
+    parser.add_argument("--openmetrics", action="store_true", help="Also write the run report in OpenMetrics format.")
+    parser.add_argument("--metrics-port", type=int, default=None, help="Serve live OpenMetrics on this local port during the run.")
+    parser.add_argument("--stream", action="store_true", help="Read and write the workbook in batches with bounded memory.")
+    parser.add_argument("--batch-size", type=int, default=200, help="Rows per batch in --stream mode.")
+    parser.add_argument("--input", default="Samsung Content.xlsx", help="Input workbook (.xlsx, or .csv/.parquet with --stream).")
+    parser.add_argument("--output", default="output/Samsung-output.xlsx", help="Output file (.xlsx, or .csv/.parquet with --stream).")
+    parser.add_argument("--resume", action="store_true", help="Continue from the journal of a previous, interrupted run.")
+    parser.add_argument("--no-change-detection", action="store_true", help="Parse every product page instead of reusing unchanged ones.")
+    parser.add_argument("--serve", action="store_true", help="Keep the browser warm and answer lookups over HTTP instead of processing the workbook.")
+    parser.add_argument("--port", type=int, default=8765, help="Local port for --serve.")
+    parser.add_argument("--socket", default=None, help="Unix socket path for --serve instead of --port.")
+    parser.add_argument("--cdp-url", default=None, help="Attach to a running Chromium over CDP (e.g. http://localhost:9222) instead of launching one.")
+    parser.add_argument("--shards", type=int, default=1, help="Split the rows across this many processes, each with its own browser.")
+    parser.add_argument("--parse-workers", type=int, default=None, help="Processes for HTML parsing (default: 1 per shard with --shards, else parse inline).")
+    args = parser.parse_args()
+    if args.cdp_url and args.max_rss_mb:
+        parser.error("--max-rss-mb only works for a browser this process launches, not with --cdp-url")
+
     output_dir = 'output'
     os.makedirs(output_dir, exist_ok=True)
-    scraper = SamsungScraper(
-        excel_path="Samsung Content.xlsx",
-        output_filename="output/Samsung-output.xlsx",
+    options = dict(
+        excel_path=args.input,
+        output_filename=args.output,
         baseurl = "https://www.samsung.com/us/search/searchMain/?listType=g&searchTerm=",
         found = 0 ,
         missing = 0,
-        headless=False
+        headless=False,
+        concurrency=args.concurrency,
+        cache_path="output/samsung-cache.sqlite",
+        fingerprint_path=None if args.no_change_detection else "output/samsung-fingerprints.sqlite",
+        refresh_cache=args.refresh_cache,
+        journal_path="output/samsung-journal.jsonl",
+        resume=args.resume,
+        resource_policy=None if args.no_block else ResourcePolicy(),
+        http_fast_path=not args.browser_only,
+        parser_backend=args.parser,
+        max_rss_mb=args.max_rss_mb,
+        batch_search=not args.no_batch_search,
+        report_path="output/samsung-run-report",
+        openmetrics=args.openmetrics,
+        metrics_port=args.metrics_port,
+        streaming=args.stream,
+        batch_size=args.batch_size,
+        cdp_url=args.cdp_url
     )
-    asyncio.run(scraper.run())
\ No newline at end of file
+    if args.serve:
+        from lookup_service import LookupService
+        options.update(excel_path=None, journal_path=None, report_path=None, batch_search=False)
+
+        async def serve():
+            async with LookupService(SamsungScraper(**options)) as service:
+                await service.serve(port=args.port, socket_path=args.socket)
+
+        try:
+            asyncio.run(serve())
+        except KeyboardInterrupt:
+            pass
+    elif args.shards > 1:
+        from sharded_run import run_sharded
+        options["parse_workers"] = 1 if args.parse_workers is None else args.parse_workers
+        run_sharded(options, args.shards)
+    else:
+        scraper = SamsungScraper(**options, parse_workers=args.parse_workers or 0)
+        asyncio.run(scraper.run())
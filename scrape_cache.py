@@ -0,0 +1,94 @@
+import json
+import re
+import sqlite3
+import time
+
+
+class ScrapeCache:
+    """SQLite cache of search term -> product URL and product URL -> parsed product record.
+
+    Both tables expire entries after a TTL and are capped in size; once a table
+    grows past `max_entries` the least recently used rows are evicted.
+    """
+    TABLES = ("search", "product")
+
+    def __init__(self, path: str, search_ttl: float = 7 * 24 * 3600, product_ttl: float = 7 * 24 * 3600, max_entries: int = 50000):
+        self.path = path
+        self.ttl = {"search": search_ttl, "product": product_ttl}
+        self.max_entries = max_entries
+        self.conn = sqlite3.connect(path, timeout=30)
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS search (key TEXT PRIMARY KEY, url TEXT, created REAL, accessed REAL)"
+        )
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS product (key TEXT PRIMARY KEY, data TEXT, created REAL, accessed REAL)"
+        )
+        self.conn.commit()
+        self.purge_expired()
+
+    @staticmethod
+    def normalize_term(search_term: str, mfr_number: str = "") -> str:
+        """Normalize a search term; the mfr number is part of the key because it drives result matching."""
+        term = re.sub(r"\s+", " ", str(search_term)).strip().lower()
+        mfr = re.sub(r"\s+", " ", str(mfr_number or "")).strip().lower()
+        return f"{term}|{mfr}"
+
+    def _get(self, table: str, key: str, column: str):
+        row = self.conn.execute(f"SELECT {column}, created FROM {table} WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        if time.time() - row[1] > self.ttl[table]:
+            self.conn.execute(f"DELETE FROM {table} WHERE key = ?", (key,))
+            self.conn.commit()
+            return None
+        self.conn.execute(f"UPDATE {table} SET accessed = ? WHERE key = ?", (time.time(), key))
+        self.conn.commit()
+        return row
+
+    def _set(self, table: str, key: str, column: str, value):
+        now = time.time()
+        self.conn.execute(
+            f"INSERT OR REPLACE INTO {table} (key, {column}, created, accessed) VALUES (?, ?, ?, ?)",
+            (key, value, now, now),
+        )
+        self._evict(table)
+        self.conn.commit()
+
+    def _evict(self, table: str):
+        """Drop least recently used rows beyond the size cap."""
+        count = self.conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+        overflow = count - self.max_entries
+        if overflow > 0:
+            self.conn.execute(
+                f"DELETE FROM {table} WHERE key IN (SELECT key FROM {table} ORDER BY accessed ASC LIMIT ?)",
+                (overflow,),
+            )
+
+    def get_search(self, search_term: str, mfr_number: str = ""):
+        """Return (hit, url). A hit with url None is a cached negative result."""
+        row = self._get("search", self.normalize_term(search_term, mfr_number), "url")
+        if row is None:
+            return False, None
+        return True, row[0]
+
+    def set_search(self, search_term: str, mfr_number: str, url):
+        """Store the resolved URL for a search, or None for a negative result."""
+        self._set("search", self.normalize_term(search_term, mfr_number), "url", url)
+
+    def get_product(self, url: str):
+        """Return the cached product record for a URL, or None."""
+        row = self._get("product", url, "data")
+        return json.loads(row[0]) if row else None
+
+    def set_product(self, url: str, data: dict):
+        self._set("product", url, "data", json.dumps(data))
+
+    def purge_expired(self):
+        """Delete every expired row from both tables."""
+        now = time.time()
+        for table in self.TABLES:
+            self.conn.execute(f"DELETE FROM {table} WHERE created < ?", (now - self.ttl[table],))
+        self.conn.commit()
+
+    def close(self):
+        self.conn.close()
@@ -0,0 +1,133 @@
+import asyncio
+import glob
+import json
+import multiprocessing
+import os
+import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+import pandas as pd
+from rich import print
+from run_journal import read_journal
+from samsungcrawler import SamsungScraper, apply_entries
+
+
+FINISHED = ("found", "missing")
+
+
+def shard_path(path: str, shard: int):
+    """Per-shard variant of a journal or report path, e.g. journal.shard3.jsonl."""
+    root, extension = os.path.splitext(path)
+    return f"{root}.shard{shard}{extension}"
+
+
+def shard_journals(journal_path: str):
+    root, extension = os.path.splitext(journal_path)
+    return sorted(glob.glob(f"{glob.escape(root)}.shard*{extension}"))
+
+
+def read_shard_entries(journal_path: str):
+    """Merge every shard journal into {index: entry}.
+
+    A row retried in another shard after a failure can appear in two journals;
+    a found/missing entry always beats a retryable or error one.
+    """
+    entries = {}
+    for path in shard_journals(journal_path):
+        for index, entry in read_journal(path).items():
+            if index not in entries or entry["status"] in FINISHED:
+                entries[index] = entry
+    return entries
+
+
+def assign_shards(df, indexes, shards: int):
+    """Split row indexes into `shards` lists of similar size.
+
+    Rows of the same model family stay together so each family's batch search
+    runs in a single shard; families are dealt largest first to the least
+    loaded shard, which makes the split deterministic for a given input.
+    """
+    groups = defaultdict(list)
+    for index in indexes:
+        family = SamsungScraper.model_family(df.at[index, "mfr number"])
+        groups[family or f"row:{index}"].append(int(index))
+    assignment = [[] for _ in range(shards)]
+    for _, members in sorted(groups.items(), key=lambda item: (-len(item[1]), item[0])):
+        min(assignment, key=len).extend(members)
+    return assignment
+
+
+def run_shard(options: dict, shard: int, rows):
+    """Process entry point: scrape `rows` with its own browser and journal."""
+    options = dict(options)
+    options["journal_path"] = shard_path(options["journal_path"], shard)
+    options["resume"] = True
+    if options.get("report_path"):
+        options["report_path"] = shard_path(options["report_path"], shard)
+    if options.get("metrics_port"):
+        options["metrics_port"] += shard
+    scraper = SamsungScraper(**options, shard_rows=rows)
+    start = time.perf_counter()
+    asyncio.run(scraper.run())
+    return {
+        "shard": shard,
+        "rows": len(rows),
+        "retryable": scraper.retryable,
+        "errors": scraper.errors,
+        "elapsed_s": time.perf_counter() - start,
+    }
+
+
+def run_sharded(options: dict, shards: int):
+    """Run the scraper in `shards` processes, then merge their journals into the workbook.
+
+    `options` are SamsungScraper keyword arguments and must include `journal_path`:
+    each shard journals to its own file next to it. With `resume`, rows already
+    finished in any shard journal are skipped and the rest are re-split.
+    """
+    if not options.get("journal_path"):
+        raise ValueError("Sharded runs need a journal_path to merge the shards from")
+    if options.get("streaming"):
+        raise ValueError("Sharded runs write the workbook in the merge step and can't be combined with streaming")
+    df = pd.read_excel(options["excel_path"], sheet_name="Grainger")
+    if options.get("resume"):
+        done = {index for index, entry in read_shard_entries(options["journal_path"]).items() if entry["status"] in FINISHED}
+    else:
+        done = set()
+        for path in shard_journals(options["journal_path"]):
+            os.remove(path)
+    pending = [index for index in df.index if int(index) not in done]
+    assignment = [rows for rows in assign_shards(df, pending, shards) if rows]
+    print(f"[cyan]Sharded run: {len(pending)} rows across {len(assignment)} processes ({len(done)} already done)[/cyan]")
+
+    shard_stats = []
+    if assignment:
+        with ProcessPoolExecutor(len(assignment), mp_context=multiprocessing.get_context("spawn")) as executor:
+            futures = [executor.submit(run_shard, options, shard, rows) for shard, rows in enumerate(assignment)]
+            for future in futures:
+                try:
+                    shard_stats.append(future.result())
+                except Exception as e:
+                    # The shard's journal still holds every row it finished.
+                    print(f"[red]Shard failed: {e}[/red]")
+    return merge_shards(df, options, shard_stats)
+
+
+def merge_shards(df, options: dict, shard_stats=()):
+    """Rebuild the Grainger sheet from the shard journals, in the input's row order."""
+    entries = read_shard_entries(options["journal_path"])
+    apply_entries(df, entries)
+    df.to_excel(options["output_filename"], index=False, sheet_name="Grainger")
+    statuses = [entry["status"] for entry in entries.values()]
+    totals = {status: statuses.count(status) for status in ("found", "missing", "retryable", "error")}
+    print(f"[red]Missing : {totals['missing']} [/red]")
+    print(f"[green]Found : {totals['found']} [/green]")
+    if totals["retryable"]:
+        print(f"[yellow]Retryable errors : {totals['retryable']} (rerun with --resume) [/yellow]")
+    if totals["error"]:
+        print(f"[red]Errors : {totals['error']} (rerun with --resume) [/red]")
+    if options.get("report_path"):
+        with open(options["report_path"] + ".json", "w", encoding="utf-8") as f:
+            json.dump({"totals": totals, "shards": list(shard_stats)}, f, indent=2)
+        print(f"[cyan]Merged report written to {options['report_path']}.json[/cyan]")
+    return totals
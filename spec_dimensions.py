@@ -0,0 +1,170 @@
+import json
+import os
+import re
+from fractions import Fraction
+
+
+DEFAULT_KEYS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "spec_keys.json")
+GROUPS = ("dimension", "weight", "shipping_weight")
+
+NUMBER_RE = re.compile(r"[\d.]+")
+DIMENSIONS_RE = re.compile(r"([\d.]+)[\"']?\s*[D|d]?\s*[xX]\s*([\d.]+)[\"']?\s*[H|h]?\s*[xX]\s*([\d.]+)[\"']?\s*[W|w]?")
+FRACTION_DIMENSIONS_RE = re.compile(r"([\d\s/]+)[\"']?\s*[W|w]?\s*[xX]\s*([\d\s/]+)[\"']?\s*[H|h]?\s*[xX]\s*([\d\s/]+)[\"']?\s*[D|d]?")
+LENGTH_UNIT_RE = re.compile(r"\b(mm|cm|in|inch|inches)\b|\"", re.IGNORECASE)
+WEIGHT_UNIT_RE = re.compile(r"\b(kg|kgs|g|lb|lbs|pounds?)\b", re.IGNORECASE)
+
+LENGTH_UNITS = {"mm": "mm", "cm": "cm", "in": "in", "inch": "in", "inches": "in", '"': "in"}
+WEIGHT_UNITS = {"kg": "kg", "kgs": "kg", "g": "g", "lb": "lb", "lbs": "lb", "pound": "lb", "pounds": "lb"}
+TO_INCHES = {"in": 1.0, "cm": 1 / 2.54, "mm": 1 / 25.4}
+TO_POUNDS = {"lb": 1.0, "kg": 2.20462, "g": 0.00220462}
+
+
+class SpecKeyRegistry:
+    """Lookup of spec keys (case-insensitive) to the field groups they feed.
+
+    Keys come from spec_keys.json; `extend` merges another JSON file of the same
+    shape ({"dimension": [...], "weight": [...], "shipping_weight": [...]}).
+    A key may belong to several groups.
+    """
+    def __init__(self, path: str = DEFAULT_KEYS_PATH):
+        self.keys = {}
+        self.extend(path)
+
+    def extend(self, path: str):
+        with open(path, encoding="utf-8") as f:
+            config = json.load(f)
+        for group, keys in config.items():
+            if group not in GROUPS:
+                raise ValueError(f"Unknown spec key group {group!r} in {path}, expected one of {GROUPS}")
+            for key in keys:
+                self.add(group, key)
+
+    def add(self, group: str, key: str):
+        normalized = key.lower()
+        self.keys[normalized] = self.keys.get(normalized, frozenset()) | {group}
+
+    def groups(self, key: str):
+        return self.keys.get(key.lower(), frozenset())
+
+
+REGISTRY = SpecKeyRegistry()
+if os.environ.get("SAMSUNG_SPEC_KEYS"):
+    REGISTRY.extend(os.environ["SAMSUNG_SPEC_KEYS"])
+
+
+def extract_number(value):
+    """Extracts the first numeric value from a string."""
+    match = NUMBER_RE.search(value)
+    return match.group(0) if match else None
+
+
+def convert_to_decimal(fraction_str):
+    """Converts a fraction string (e.g., '1/10') to a decimal number."""
+    try:
+        return float(Fraction(fraction_str))
+    except ValueError:
+        return None
+
+
+def extract_dimensions_from_string(value):
+    """Extracts width, height, and depth from a formatted dimension string (e.g., '22.9" D x 32.0" H x 23.7" W')."""
+    match = DIMENSIONS_RE.search(value)
+    if match:
+        return match.groups()
+    return extract_dimensions_from_string_fraction(value)
+
+
+def extract_dimensions_from_string_fraction(value):
+    """Extracts width, height, and depth from a formatted dimension string (e.g., '30" W x 5 1/10" H x 21 1/4" D')."""
+    match = FRACTION_DIMENSIONS_RE.search(value)
+    if match:
+        return tuple(convert_to_decimal(part.replace(" ", "").replace('"', '')) for part in match.groups())
+    return None
+
+
+def detect_unit(key: str, value: str, pattern, units):
+    """Unit named in the value, else in the key (e.g. "(lbs.)"), else None."""
+    for text in (value, key):
+        match = pattern.search(text)
+        if match:
+            return units[(match.group(1) or match.group(0)).lower()]
+    return None
+
+
+def extract_dimensions(data, registry: SpecKeyRegistry = REGISTRY, with_units: bool = False):
+    """Pull width/height/depth/weight/shipping weight and electrical ratings out of a spec dict.
+
+    Returns (dimensions, [volts, hertz, amps, watts]). With `with_units`, the
+    dimensions dict also carries "length_unit", "weight_unit" and "shipping_weight_unit".
+    """
+    dimensions = {"width": None, "height": None, "depth": None, "weight": None, "shipping_weight": None}
+    length_unit = weight_unit = shipping_weight_unit = None
+    voltz = ""
+    hertz = ""
+    amps = ""
+    watts = ""
+
+    for section, attributes in data.items():
+        if isinstance(attributes, dict):
+            for key, value in attributes.items():
+                if isinstance(value, str):
+                    groups = registry.groups(key)
+                    if groups:
+                        if "dimension" in groups:
+                            dim_match = extract_dimensions_from_string(value)
+                            if dim_match:
+                                dimensions["width"], dimensions["height"], dimensions["depth"] = dim_match
+                                length_unit = detect_unit(key, value, LENGTH_UNIT_RE, LENGTH_UNITS)
+                        if "weight" in groups:
+                            dimensions["weight"] = extract_number(value)
+                            weight_unit = detect_unit(key, value, WEIGHT_UNIT_RE, WEIGHT_UNITS)
+                        if "shipping_weight" in groups:
+                            dimensions["shipping_weight"] = extract_number(value)
+                            shipping_weight_unit = detect_unit(key, value, WEIGHT_UNIT_RE, WEIGHT_UNITS)
+
+                if "Voltz/Hertz/Amps" in key:
+                    voltz, hertz, amps = map(str.strip, value.split("/"))
+                elif "Watts" in key:
+                    watts = value.strip()
+                elif "Voltz" in key and all(x not in key for x in ["Hertz", "Amps"]):
+                    voltz = value.strip()
+                elif "Hertz" in key and all(x not in key for x in ["Voltz", "Amps"]):
+                    hertz = value.strip()
+                elif "Amps" in key and all(x not in key for x in ["Voltz", "Hertz"]):
+                    amps = value.strip()
+
+    if with_units:
+        dimensions["length_unit"] = length_unit
+        dimensions["weight_unit"] = weight_unit
+        dimensions["shipping_weight_unit"] = shipping_weight_unit
+    return dimensions, [voltz, hertz, amps, watts]
+
+
+def extract_dimensions_batch(spec_dicts, registry: SpecKeyRegistry = REGISTRY, normalize_units: bool = False):
+    """Run extract_dimensions over many spec dicts and return one DataFrame row per dict.
+
+    Numeric columns are converted in bulk; with `normalize_units`, lengths are
+    converted to inches and weights to pounds where a unit was detected.
+    """
+    import pandas as pd
+
+    rows = []
+    for data in spec_dicts:
+        dimensions, (volts, hertz, amps, watts) = extract_dimensions(data or {}, registry, with_units=True)
+        dimensions.update(volts=volts, hertz=hertz, amps=amps, watts=watts)
+        rows.append(dimensions)
+    frame = pd.DataFrame(rows, columns=[
+        "width", "height", "depth", "weight", "shipping_weight", "length_unit", "weight_unit",
+        "shipping_weight_unit", "volts", "hertz", "amps", "watts",
+    ])
+    numeric = ["width", "height", "depth", "weight", "shipping_weight"]
+    frame[numeric] = frame[numeric].apply(pd.to_numeric, errors="coerce")
+    if normalize_units:
+        length_factor = frame["length_unit"].map(TO_INCHES).fillna(1.0)
+        frame[["width", "height", "depth"]] = frame[["width", "height", "depth"]].mul(length_factor, axis=0)
+        # Product and shipping weight are often given in different units; each uses its own.
+        for column, unit in (("weight", "weight_unit"), ("shipping_weight", "shipping_weight_unit")):
+            frame[column] = frame[column] * frame[unit].map(TO_POUNDS).fillna(1.0)
+            frame.loc[frame[unit].notna(), unit] = "lb"
+        frame.loc[frame["length_unit"].notna(), "length_unit"] = "in"
+    return frame
@@ -0,0 +1,45 @@
+import pandas as pd
+
+from samsungcrawler import apply_entries
+
+
+def frame():
+    return pd.DataFrame({"mfr number": ["A", "B", "C"], "Price": [1.5, 2.5, 3.5], "Scrape Status": [None, None, None]})
+
+
+def test_rows_only_change_their_own_columns():
+    df = frame()
+    apply_entries(df, {
+        0: {"status": "found", "values": {"Price": 9, "Scrape Status": "Found", "Weight": 3}},
+        1: {"status": "missing", "values": {"Scrape Status": "Not found"}},
+    })
+    assert df["Price"].tolist() == [9, 2.5, 3.5]
+    assert df["Scrape Status"].tolist() == ["Found", "Not found", None]
+    assert df["Weight"].tolist() == [3, None, None]
+
+
+def test_explicit_none_overwrites_the_input():
+    df = frame()
+    apply_entries(df, {2: {"status": "found", "values": {"Price": None, "Scrape Status": "Found"}}})
+    assert df.at[2, "Price"] is None
+    assert df.at[1, "Price"] == 2.5
+
+
+def test_matches_streaming_merge():
+    df = frame()
+    entries = {
+        0: {"status": "found", "values": {"Price": None, "Weight": 3}},
+        2: {"status": "retryable", "values": {"Scrape Status": "Retryable error (timeout)"}},
+    }
+    expected = [{**row, **entries[index]["values"]} if index in entries else row
+                for index, row in enumerate(frame().to_dict("records"))]
+    apply_entries(df, entries)
+    for index, row in enumerate(expected):
+        for column, value in row.items():
+            assert df.at[index, column] == value or (value is None and df.at[index, column] is None)
+
+
+def test_entries_without_values_are_a_no_op():
+    df = frame()
+    apply_entries(df, {0: {"status": "missing", "values": {}}})
+    pd.testing.assert_frame_equal(df, frame())
@@ -0,0 +1,54 @@
+from itertools import permutations
+
+import pytest
+
+from model_index import EXACT, PREFIX, VARIANT, ModelIndex, normalize_code
+from samsungcrawler import SamsungScraper
+
+CARDS = [
+    ("QN65Q80C", "/short"),
+    ("QN65Q80CAFXZA", "/full"),
+    ("QN65", "/family"),
+    ("RF28R7351SG/AA", "/fridge"),
+    ("NE63T8511SS/AA", "/range"),
+]
+
+
+def test_normalize_code():
+    assert normalize_code(" qn65q80c/za ") == ("QN65Q80CZA", "QN65Q80C")
+    assert normalize_code(None) == ("", "")
+
+
+@pytest.mark.parametrize("cards", list(permutations(CARDS[:2])))
+def test_longer_code_wins_regardless_of_card_order(cards):
+    # The old substring scan returned whichever card came first whose code was
+    # contained in the mfr number, so "QN65Q80C" could shadow the real model.
+    assert ModelIndex(cards).match("QN65Q80CAFXZA") == (EXACT, "QN65Q80CAFXZA", "/full")
+
+
+@pytest.mark.parametrize("cards", [CARDS, CARDS[::-1]])
+def test_ranking(cards):
+    index = ModelIndex(cards)
+    assert index.match("RF28R7351SG/ZA") == (VARIANT, "RF28R7351SG/AA", "/fridge")
+    assert index.match("NE63T8511SS") == (VARIANT, "NE63T8511SS/AA", "/range")
+    assert index.match("QN65Q80CAF") == (PREFIX, "QN65Q80CAFXZA", "/full")
+    assert index.best("qn65q80cafxza") == "/full"
+
+
+def test_short_family_codes_never_match():
+    index = ModelIndex([("QN65", "/family"), ("WF45", "/washer")])
+    assert index.match("QN65Q80CAFXZA") is None
+    assert index.best("WF45T6000AW/A5") is None
+
+
+def test_cards_without_code_or_href_are_ignored():
+    index = ModelIndex([("", "/a"), ("QN65Q80C", None), ("QN65Q80C", "/b"), ("QN65Q80C", "/dup")])
+    assert len(index) == 1
+    assert index.best("QN65Q80C") == "/b"
+
+
+def test_match_listing_leaves_prefix_matches_to_the_row_search():
+    index = ModelIndex(CARDS)
+    assert SamsungScraper.match_listing(index, "QN65Q80CAFXZA") == "/full"
+    assert SamsungScraper.match_listing(index, "RF28R7351SG/ZA") == "/fridge"
+    assert SamsungScraper.match_listing(index, "QN65Q80CAF") is None
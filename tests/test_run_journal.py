@@ -0,0 +1,56 @@
+import json
+
+from run_journal import RunJournal, read_journal
+
+
+def write_lines(path, *entries, tail=""):
+    with open(path, "w", encoding="utf-8") as f:
+        for entry in entries:
+            f.write(json.dumps(entry) + "\n")
+        f.write(tail)
+
+
+def entry(index, status="found"):
+    return {"index": index, "status": status, "values": {"Scrape Status": status}}
+
+
+def test_resume_truncates_half_written_line(tmp_path):
+    path = str(tmp_path / "journal.jsonl")
+    write_lines(path, entry(0), entry(1, "missing"), tail='{"index": 2, "status": "fo')
+    journal = RunJournal(path, resume=True)
+    assert sorted(journal.entries) == [0, 1]
+    journal.append(2, "found", {"Scrape Status": "found"})
+    journal.close()
+    assert sorted(read_journal(path)) == [0, 1, 2]
+    with open(path, encoding="utf-8") as f:
+        assert all(json.loads(line) for line in f)
+
+
+def test_partial_line_longer_than_one_block(tmp_path):
+    path = str(tmp_path / "journal.jsonl")
+    write_lines(path, entry(0), tail='{"index": 1, "values": {"x": "' + "y" * 10_000)
+    RunJournal(path, resume=True).close()
+    with open(path, encoding="utf-8") as f:
+        assert f.read() == json.dumps(entry(0)) + "\n"
+
+
+def test_journal_with_only_a_partial_line_is_emptied(tmp_path):
+    path = str(tmp_path / "journal.jsonl")
+    write_lines(path, tail='{"index": 0')
+    journal = RunJournal(path, resume=True)
+    journal.close()
+    assert journal.entries == {}
+    with open(path, encoding="utf-8") as f:
+        assert f.read() == ""
+
+
+def test_complete_journal_is_left_alone(tmp_path):
+    path = str(tmp_path / "journal.jsonl")
+    write_lines(path, entry(0), entry(0, "missing"))
+    with open(path, encoding="utf-8") as f:
+        before = f.read()
+    journal = RunJournal(path, resume=True)
+    journal.close()
+    assert journal.entries[0]["status"] == "missing"
+    with open(path, encoding="utf-8") as f:
+        assert f.read() == before
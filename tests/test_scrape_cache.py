@@ -0,0 +1,52 @@
+import pytest
+
+import scrape_cache
+from scrape_cache import ScrapeCache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1_000_000.0]
+    monkeypatch.setattr(scrape_cache.time, "time", lambda: now[0])
+    return now
+
+
+def test_search_hits_and_negative_results(tmp_path, clock):
+    cache = ScrapeCache(str(tmp_path / "cache.sqlite"))
+    assert cache.get_search("QN65Q80C", "QN65Q80C") == (False, None)
+    cache.set_search("QN65Q80C", "QN65Q80C", "https://example.com/tv")
+    cache.set_search("NOPE", "NOPE", None)
+    assert cache.get_search("  qn65q80c ", "QN65Q80C") == (True, "https://example.com/tv")
+    assert cache.get_search("NOPE", "NOPE") == (True, None)
+
+
+def test_entries_expire_after_ttl(tmp_path, clock):
+    cache = ScrapeCache(str(tmp_path / "cache.sqlite"), search_ttl=60, product_ttl=120)
+    cache.set_search("A", "A", "https://example.com/a")
+    cache.set_product("https://example.com/a", {"price": "$1"})
+    clock[0] += 90
+    assert cache.get_search("A", "A") == (False, None)
+    assert cache.get_product("https://example.com/a") == {"price": "$1"}
+    clock[0] += 60
+    assert cache.get_product("https://example.com/a") is None
+
+
+def test_purge_expired_on_open(tmp_path, clock):
+    path = str(tmp_path / "cache.sqlite")
+    ScrapeCache(path, search_ttl=60).set_search("A", "A", "https://example.com/a")
+    clock[0] += 61
+    cache = ScrapeCache(path, search_ttl=60)
+    assert cache.conn.execute("SELECT COUNT(*) FROM search").fetchone()[0] == 0
+
+
+def test_least_recently_used_entry_is_evicted(tmp_path, clock):
+    cache = ScrapeCache(str(tmp_path / "cache.sqlite"), max_entries=2)
+    for term in ("A", "B"):
+        cache.set_search(term, term, f"https://example.com/{term}")
+        clock[0] += 1
+    assert cache.get_search("A", "A")[0]  # A is now more recently used than B.
+    clock[0] += 1
+    cache.set_search("C", "C", "https://example.com/C")
+    assert cache.get_search("A", "A")[0]
+    assert cache.get_search("B", "B") == (False, None)
+    assert cache.get_search("C", "C")[0]